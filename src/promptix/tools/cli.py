@@ -5,6 +5,8 @@ Modern, user-friendly command-line interface with beautiful output.
 
 import sys
 import os
+import json
+import importlib.util
 import subprocess
 import socket
 import shutil
@@ -41,6 +43,76 @@ def find_available_port(start_port: int, max_attempts: int = 10) -> Optional[int
             return port
     return None
 
+# Where a background Studio started with --daemon records its PID and port
+STUDIO_PID_FILE = Path.home() / ".promptix" / "studio.pid"
+
+def configure_streamlit_env(headless: bool = False) -> None:
+    """Disable Streamlit start-up work Promptix doesn't need, unless the user overrides it."""
+    os.environ.setdefault("STREAMLIT_BROWSER_GATHER_USAGE_STATS", "false")
+    if headless:
+        os.environ.setdefault("STREAMLIT_SERVER_HEADLESS", "true")
+
+def is_process_alive(pid: int) -> bool:
+    """Check whether a process with the given PID is still running."""
+    if os.name == "nt":
+        # os.kill() terminates processes on Windows, so callers rely on the port check
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def get_studio_workspace() -> str:
+    """Return the resolved directory whose prompts a Studio launched from here edits."""
+    return str(Path.cwd().resolve())
+
+def get_running_studio() -> Optional[dict]:
+    """Return the PID file contents of a live background Studio, if any."""
+    try:
+        info = json.loads(STUDIO_PID_FILE.read_text())
+        pid, port = int(info["pid"]), int(info["port"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    if is_process_alive(pid) and is_port_in_use(port):
+        # PID files written before the workspace was recorded have no "cwd"
+        return {"pid": pid, "port": port, "cwd": info.get("cwd")}
+    
+    # Stale PID file from a Studio that has since exited
+    STUDIO_PID_FILE.unlink(missing_ok=True)
+    return None
+
+def start_studio_daemon(streamlit_path: str, app_path: str, port: int) -> int:
+    """Start Studio in a detached background process and record its PID."""
+    STUDIO_PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+    workspace = get_studio_workspace()
+    log_path = STUDIO_PID_FILE.with_name("studio.log")
+    
+    popen_kwargs = {}
+    if os.name == "nt":
+        popen_kwargs["creationflags"] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        popen_kwargs["start_new_session"] = True
+    
+    with open(log_path, "ab") as log_file:
+        process = subprocess.Popen(
+            [streamlit_path, "run", app_path, "--server.port", str(port)],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            env=os.environ.copy(),
+            cwd=workspace,
+            **popen_kwargs
+        )
+    
+    STUDIO_PID_FILE.write_text(json.dumps({"pid": process.pid, "port": port, "cwd": workspace}))
+    return process.pid
+
 @click.group()
 @click.version_option()
 def cli():
@@ -58,11 +130,41 @@ def cli():
     type=int,
     help='Port to run the studio on'
 )
-def studio(port: int):
+@click.option(
+    '--daemon', '-d',
+    is_flag=True,
+    help='Run the studio in the background and return immediately'
+)
+def studio(port: int, daemon: bool):
     """🎨 Launch Promptix Studio web interface"""
-    # Resolve and validate streamlit executable
-    streamlit_path = shutil.which("streamlit")
-    if not streamlit_path:
+    # Reuse a Studio already running in the background for this project instead of spawning another
+    running = get_running_studio()
+    if running and running["cwd"] != get_studio_workspace():
+        # The PID file is shared by every project, and that Studio edits another one's prompts
+        console.print(
+            f"[yellow]⚠️  A Studio for {running['cwd'] or 'another project'} is running on port "
+            f"{running['port']} (PID {running['pid']}). Starting a separate Studio for this "
+            f"project.[/yellow]"
+        )
+    elif running:
+        console.print(Panel(
+            f"[bold green]✅ Promptix Studio is already running[/bold green]\n\n"
+            f"[blue]PID:[/blue] {running['pid']}\n"
+            f"[blue]URL:[/blue] http://localhost:{running['port']}",
+            title="Promptix Studio",
+            border_style="green"
+        ))
+        port_source = click.get_current_context().get_parameter_source("port")
+        if port_source is not click.core.ParameterSource.DEFAULT and port != running["port"]:
+            console.print(
+                f"[yellow]⚠️  Ignoring --port {port}: Studio is already running on port "
+                f"{running['port']}. Stop it with: kill {running['pid']}[/yellow]"
+            )
+        return
+    
+    # Foreground runs need the streamlit package, --daemon needs its executable
+    streamlit_path = shutil.which("streamlit") if daemon else None
+    if (daemon and not streamlit_path) or importlib.util.find_spec("streamlit") is None:
         error_console.print(
             "[bold red]❌ Error:[/bold red] Streamlit is not installed.\n"
             "[yellow]💡 Fix:[/yellow] pip install streamlit"
@@ -108,6 +210,21 @@ def studio(port: int):
             console.print(f"[green]✅ Found available port: {new_port}[/green]")
             port = new_port
 
+        configure_streamlit_env(headless=daemon)
+
+        if daemon:
+            pid = start_studio_daemon(streamlit_path, app_path, port)
+            console.print(Panel(
+                f"[bold green]🚀 Promptix Studio started in the background[/bold green]\n\n"
+                f"[blue]PID:[/blue] {pid}\n"
+                f"[blue]URL:[/blue] http://localhost:{port}\n"
+                f"[blue]Logs:[/blue] {STUDIO_PID_FILE.with_name('studio.log')}\n"
+                f"[dim]Stop it with: kill {pid}[/dim]",
+                title="Promptix Studio",
+                border_style="green"
+            ))
+            return
+
         # Create a nice panel with launch information
         launch_panel = Panel(
             f"[bold green]🚀 Launching Promptix Studio[/bold green]\n\n"
@@ -119,22 +236,25 @@ def studio(port: int):
         )
         console.print(launch_panel)
         
-        subprocess.run(
-            [streamlit_path, "run", app_path, "--server.port", str(port)],
-            check=True
-        )
-    except FileNotFoundError:
+        # Run the Streamlit server in this process rather than paying for a
+        # second interpreter start-up through the `streamlit` console script
+        from streamlit.web import bootstrap
+        
+        flag_options = {"server.port": port}
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(app_path, False, [], flag_options)
+    except (FileNotFoundError, ImportError):
         error_console.print(
             "[bold red]❌ Error:[/bold red] Streamlit is not installed.\n"
             "[yellow]💡 Fix:[/yellow] pip install streamlit"
         )
         sys.exit(1)
-    except subprocess.CalledProcessError as e:
-        error_console.print(f"[bold red]❌ Error launching Promptix Studio:[/bold red] {str(e)}")
-        sys.exit(1)
     except KeyboardInterrupt:
         console.print("\n[green]👋 Thanks for using Promptix Studio! See you next time![/green]")
         sys.exit(0)
+    except Exception as e:
+        error_console.print(f"[bold red]❌ Error launching Promptix Studio:[/bold red] {str(e)}")
+        sys.exit(1)
 
 @cli.group()
 def agent():
@@ -34,6 +34,10 @@ class PromptManager:
         """Get a specific prompt by ID."""
         return self._folder_manager.get_prompt(prompt_id)
     
+    def get_prompt_mtime(self, prompt_id: str) -> float:
+        """Get the latest modification time across a prompt's files."""
+        return self._folder_manager.get_prompt_mtime(prompt_id)
+    
     def save_prompt(self, prompt_id: str, prompt_data: Dict):
         """Save or update a prompt."""
         return self._folder_manager.save_prompt(prompt_id, prompt_data)
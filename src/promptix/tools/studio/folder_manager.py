@@ -6,16 +6,83 @@ instead of a single YAML file.
 """
 
 import os
+import json
+import hashlib
+import heapq
+import threading
 import yaml
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 from promptix.core.storage.utils import create_default_prompts_folder
 from promptix.core.storage.loaders import PromptLoaderFactory
 from promptix.core.config import config
 from promptix.enhancements.logging import setup_logging
-import traceback
-import shutil
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# orjson is an optional speed-up for the config.json sidecar
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+
+# Characters in a prompt name that become underscores in its ID
+_PROMPT_ID_TABLE = str.maketrans({" ": "_", "-": "_"})
+
+_load_executor: Optional[ThreadPoolExecutor] = None
+_load_executor_lock = threading.Lock()
+
+
+def _get_load_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool used to load prompt folders concurrently.
+    
+    Studio creates a new manager on almost every rerun, so the pool lives at
+    module level to avoid paying worker start-up on each load.
+    """
+    global _load_executor
+    if _load_executor is None:
+        with _load_executor_lock:
+            if _load_executor is None:
+                _load_executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix="promptix-load"
+                )
+    return _load_executor
+
+
+def _now_iso() -> str:
+    """Return the current local time as an ISO 8601 string."""
+    # A fixed timespec skips isoformat()'s auto-detection and keeps every
+    # timestamp the same width, so they still sort correctly as strings
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize config data for the JSON sidecar, raising TypeError for non-JSON values."""
+    if _orjson is not None:
+        # Pass datetimes through so they fail like they do with the stdlib encoder
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2 | _orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON sidecar file."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _content_digest(data: bytes) -> bytes:
+    """Return a short digest used to detect unchanged file contents."""
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 class FolderBasedPromptManager:
@@ -38,6 +105,12 @@ class FolderBasedPromptManager:
         # Set up logging
         self._logger = setup_logging()
         
+        # (mtime_ns, size, digest) of files last read or written, keyed by path
+        self._file_hash_cache: Dict[str, Tuple[int, int, bytes]] = {}
+        
+        # Set once the prompts directory is known to exist, to skip repeated stat() calls
+        self._prompts_dir_verified = False
+        
         # Get the prompts directory from configuration
         self.prompts_dir = self._get_prompts_directory()
         
@@ -65,10 +138,26 @@ class FolderBasedPromptManager:
         # Default to prompts/ in current directory
         return base_dir / "prompts"
     
+    def _prompts_dir_is_empty(self) -> bool:
+        """Check whether the prompts directory is missing or has no entries."""
+        # Stop at the first entry instead of listing the whole directory
+        try:
+            with os.scandir(self.prompts_dir) as entries:
+                return next(entries, None) is None
+        except (FileNotFoundError, NotADirectoryError):
+            return True
+    
     def _ensure_prompts_directory_exists(self) -> None:
         """Ensure the prompts directory exists with at least one sample prompt."""
-        if not self.prompts_dir.exists() or not any(self.prompts_dir.iterdir()):
+        if self._prompts_dir_is_empty():
             create_default_prompts_folder(self.prompts_dir)
+        self._prompts_dir_verified = True
+    
+    def _prompts_dir_exists(self) -> bool:
+        """Check whether the prompts directory exists, caching a positive result."""
+        if not self._prompts_dir_verified:
+            self._prompts_dir_verified = self.prompts_dir.exists()
+        return self._prompts_dir_verified
     
     def _migrate_yaml_to_folder_if_needed(self) -> None:
         """Check for existing YAML prompt files and migrate them to folder structure."""
@@ -80,7 +169,7 @@ class FolderBasedPromptManager:
             return
             
         # Check if we already have a folder structure with prompts
-        if self.prompts_dir.exists() and any(self.prompts_dir.iterdir()):
+        if not self._prompts_dir_is_empty():
             # Folder structure already exists and has content, don't migrate
             self._logger.info(f"Folder-based prompts already exist at {self.prompts_dir}, skipping migration")
             return
@@ -119,6 +208,7 @@ class FolderBasedPromptManager:
             
             # Create migration marker to prevent re-migration
             # Create backup of original YAML file
+            import shutil
             backup_file = legacy_yaml.parent / f"{legacy_yaml.name}.backup"
             shutil.copy2(legacy_yaml, backup_file)
             
@@ -136,7 +226,7 @@ class FolderBasedPromptManager:
     
     def _migrate_single_prompt(self, prompt_id: str, prompt_data: Dict) -> None:
         """Migrate a single prompt from YAML structure to folder structure."""
-        current_time = datetime.now().isoformat()
+        current_time = _now_iso()
         
         # Create directory structure
         prompt_dir = self.prompts_dir / prompt_id
@@ -206,7 +296,7 @@ class FolderBasedPromptManager:
         
         # Write config.yaml
         with open(prompt_dir / "config.yaml", "w", encoding="utf-8") as f:
-            yaml.dump(config_data, f, sort_keys=False, allow_unicode=True)
+            yaml.dump(config_data, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True)
         
         # Write version files and current.md
         current_content = ""
@@ -229,23 +319,128 @@ class FolderBasedPromptManager:
         with open(prompt_dir / "current.md", "w", encoding="utf-8") as f:
             f.write(current_content)
     
+    def _read_bytes(self, path: Path) -> bytes:
+        """Read a file and remember its signature for write avoidance in save_prompt."""
+        with open(path, 'rb') as f:
+            data = f.read()
+            stat = os.fstat(f.fileno())
+        self._file_hash_cache[str(path)] = (stat.st_mtime_ns, stat.st_size, _content_digest(data))
+        return data
+    
+    def _read_text(self, path: Path) -> str:
+        """Read a UTF-8 template file, normalizing Windows line endings."""
+        return self._read_bytes(path).decode('utf-8').replace('\r\n', '\n')
+    
+    def _write_if_changed(self, path: Path, text: Union[str, bytes]) -> bool:
+        """
+        Atomically write text to path unless the file already holds it.
+        
+        The write is skipped only when the content digest matches the one
+        recorded when the file was last read or written and the file has not
+        been touched on disk since then.
+        
+        Returns:
+            True if the file was written, False if the write was skipped.
+        """
+        data = text.encode('utf-8') if isinstance(text, str) else text
+        digest = _content_digest(data)
+        key = str(path)
+        
+        cached = self._file_hash_cache.get(key)
+        if cached is not None and cached[2] == digest:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == cached[:2]:
+                return False
+        
+        # Write to a sibling temp file and swap it in so readers never see a partial file
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                stat = os.fstat(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        
+        self._file_hash_cache[key] = (stat.st_mtime_ns, stat.st_size, digest)
+        return True
+    
+    def _use_json_sidecar(self) -> bool:
+        """Check whether the config.json sidecar is enabled (PROMPTIX_STORAGE_FORMAT=json)."""
+        return config.get_storage_format().lower() == "json"
+    
+    def _read_config(self, prompt_dir: Path) -> Optional[Dict]:
+        """
+        Read a prompt's config, preferring the JSON sidecar when it is enabled.
+        
+        config.yaml stays the source of truth: the sidecar is only used while it
+        is at least as new as config.yaml, so hand edits to the YAML still win.
+        
+        Returns:
+            The parsed config, or None if the prompt has no config.yaml.
+        """
+        config_file = prompt_dir / "config.yaml"
+        try:
+            yaml_mtime = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        if self._use_json_sidecar():
+            json_file = prompt_dir / "config.json"
+            try:
+                if json_file.stat().st_mtime_ns >= yaml_mtime:
+                    return _json_loads(json_file.read_bytes())
+            except (OSError, ValueError):
+                pass  # Missing or unreadable sidecar, fall back to YAML
+        
+        return yaml.load(self._read_bytes(config_file), Loader=_SafeLoader)
+    
+    def _write_config(self, prompt_dir: Path, config_data: Dict) -> None:
+        """Write config.yaml, plus the config.json sidecar when it is enabled."""
+        self._write_if_changed(
+            prompt_dir / "config.yaml",
+            yaml.dump(config_data, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True)
+        )
+        
+        if self._use_json_sidecar():
+            json_file = prompt_dir / "config.json"
+            try:
+                self._write_if_changed(json_file, _json_dumps(config_data))
+            except TypeError:
+                # Values JSON can't represent (e.g. YAML timestamps): drop the
+                # sidecar so a stale copy is never preferred over config.yaml
+                json_file.unlink(missing_ok=True)
+    
+    def _iter_prompts(self) -> Iterator[Tuple[str, Dict]]:
+        """Yield (prompt_id, prompt_data) for every loadable prompt folder."""
+        try:
+            with os.scandir(self.prompts_dir) as entries:
+                prompt_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            # Removed since it was last verified
+            self._prompts_dir_verified = False
+            return
+        
+        # Loading is I/O bound, so fan the prompt folders out over threads
+        results = _get_load_executor().map(self._load_single_prompt, prompt_dirs)
+        for prompt_dir, prompt_data in zip(prompt_dirs, results):
+            if prompt_data:
+                yield prompt_dir.name, prompt_data
+    
     def load_prompts(self) -> Dict:
         """Load all prompts from folder structure."""
         try:
             prompts_data = {"schema": 1.0}
             
-            if not self.prompts_dir.exists():
+            if not self._prompts_dir_exists():
                 return prompts_data
             
-            for prompt_dir in self.prompts_dir.iterdir():
-                if not prompt_dir.is_dir():
-                    continue
-                
-                prompt_id = prompt_dir.name
-                prompt_data = self._load_single_prompt(prompt_dir)
-                if prompt_data:
-                    prompts_data[prompt_id] = prompt_data
-            
+            prompts_data.update(self._iter_prompts())
             return prompts_data
             
         except Exception as e:
@@ -255,62 +450,62 @@ class FolderBasedPromptManager:
     def _load_single_prompt(self, prompt_dir: Path) -> Optional[Dict]:
         """Load a single prompt from its directory."""
         try:
-            config_file = prompt_dir / "config.yaml"
-            if not config_file.exists():
+            config_data = self._read_config(prompt_dir)
+            if config_data is None:
                 return None
             
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
-            
             # Read current template
             current_file = prompt_dir / "current.md"
             current_template = ""
             if current_file.exists():
-                with open(current_file, 'r') as f:
-                    current_template = f.read()
+                current_template = self._read_text(current_file)
+            
+            # Look up the shared sections once; every version references the
+            # same metadata and schema dicts, as before
+            metadata = config_data.get("metadata") or {}
+            base_config = config_data.get("config") or {}
+            schema = config_data.get("schema") or {}
+            # Only fall back to the current time when a timestamp is missing
+            created_at = metadata.get("created_at")
+            last_modified = metadata.get("last_modified")
+            if created_at is None or last_modified is None:
+                now = _now_iso()
+                created_at = now if created_at is None else created_at
+                last_modified = now if last_modified is None else last_modified
+            current_stripped = current_template.strip()
             
             # Read versioned templates
             versions = {}
             versions_dir = prompt_dir / "versions"
             if versions_dir.exists():
                 for version_file in versions_dir.glob("*.md"):
-                    version_name = version_file.stem
-                    with open(version_file, 'r') as f:
-                        template = f.read()
+                    template = self._read_text(version_file)
                     
                     # Determine if this version is live by comparing with current.md
-                    is_live = template.strip() == current_template.strip()
-                    
-                    versions[version_name] = {
-                        "is_live": is_live,
-                        "config": {
-                            "system_instruction": template,
-                            **config_data.get("config", {})
-                        },
-                        "created_at": config_data.get("metadata", {}).get("created_at", datetime.now().isoformat()),
-                        "metadata": config_data.get("metadata", {}),
-                        "schema": config_data.get("schema", {})
+                    versions[version_file.stem] = {
+                        "is_live": template.strip() == current_stripped,
+                        "config": {"system_instruction": template, **base_config},
+                        "created_at": created_at,
+                        "metadata": metadata,
+                        "schema": schema
                     }
             
             # Add current as live version if no versions found
             if not versions:
                 versions["v1"] = {
                     "is_live": True,
-                    "config": {
-                        "system_instruction": current_template,
-                        **config_data.get("config", {})
-                    },
-                    "created_at": config_data.get("metadata", {}).get("created_at", datetime.now().isoformat()),
-                    "metadata": config_data.get("metadata", {}),
-                    "schema": config_data.get("schema", {})
+                    "config": {"system_instruction": current_template, **base_config},
+                    "created_at": created_at,
+                    "metadata": metadata,
+                    "schema": schema
                 }
             
             return {
-                "name": config_data.get("metadata", {}).get("name", prompt_dir.name),
-                "description": config_data.get("metadata", {}).get("description", ""),
+                "name": metadata.get("name", prompt_dir.name),
+                "description": metadata.get("description", ""),
                 "versions": versions,
-                "created_at": config_data.get("metadata", {}).get("created_at", datetime.now().isoformat()),
-                "last_modified": config_data.get("metadata", {}).get("last_modified", datetime.now().isoformat())
+                "created_at": created_at,
+                "last_modified": last_modified
             }
         
         except Exception as e:
@@ -324,6 +519,27 @@ class FolderBasedPromptManager:
             return None
         return self._load_single_prompt(prompt_dir)
     
+    def get_prompt_mtime(self, prompt_id: str) -> float:
+        """
+        Get the latest modification time across a prompt's files.
+        
+        This only stats files, so callers can cheaply tell whether a cached copy
+        of the prompt is still current.
+        
+        Returns:
+            The newest mtime in seconds, or 0.0 if the prompt does not exist.
+        """
+        prompt_dir = self.prompts_dir / prompt_id
+        latest = 0.0
+        for folder in (prompt_dir, prompt_dir / "versions"):
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        latest = max(latest, entry.stat().st_mtime)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return latest
+    
     def save_prompt(self, prompt_id: str, prompt_data: Dict):
         """Save or update a prompt."""
         try:
@@ -331,24 +547,23 @@ class FolderBasedPromptManager:
             prompt_dir.mkdir(exist_ok=True)
             (prompt_dir / "versions").mkdir(exist_ok=True)
             
-            current_time = datetime.now().isoformat()
+            current_time = _now_iso()
             
             # Update last_modified
             prompt_data['last_modified'] = current_time
-            if 'metadata' not in prompt_data:
-                prompt_data['metadata'] = {}
-            prompt_data['metadata']['last_modified'] = current_time
+            metadata = prompt_data.setdefault('metadata', {})
+            metadata['last_modified'] = current_time
             
             # Prepare config data
             config_data = {
                 "metadata": {
                     "name": prompt_data.get("name", prompt_id),
                     "description": prompt_data.get("description", ""),
-                    "author": prompt_data.get("metadata", {}).get("author", "Promptix User"),
+                    "author": metadata.get("author", "Promptix User"),
                     "version": "1.0.0",
                     "created_at": prompt_data.get("created_at", current_time),
                     "last_modified": current_time,
-                    "last_modified_by": prompt_data.get("metadata", {}).get("last_modified_by", "Promptix User")
+                    "last_modified_by": metadata.get("last_modified_by", "Promptix User")
                 }
             }
             
@@ -370,65 +585,127 @@ class FolderBasedPromptManager:
                     del config_data["config"]["system_instruction"]
             
             # Save config.yaml
-            with open(prompt_dir / "config.yaml", 'w') as f:
-                yaml.dump(config_data, f, sort_keys=False, allow_unicode=True)
+            self._write_config(prompt_dir, config_data)
             
-            # Save templates
+            # Save templates, skipping files whose content has not changed
             for version_id, version_data in versions.items():
                 system_instruction = version_data.get("config", {}).get("system_instruction", "")
                 
                 # Save version file
-                with open(prompt_dir / "versions" / f"{version_id}.md", 'w') as f:
-                    f.write(system_instruction)
+                self._write_if_changed(prompt_dir / "versions" / f"{version_id}.md", system_instruction)
                 
                 # Update current.md if this is the live version
                 if version_data.get('is_live', False):
-                    with open(prompt_dir / "current.md", 'w') as f:
-                        f.write(system_instruction)
+                    self._write_if_changed(prompt_dir / "current.md", system_instruction)
                         
         except Exception as e:
             print(f"Error in save_prompt: {str(e)}")
+            import traceback
             print(traceback.format_exc())
             raise
     
+    @staticmethod
+    def _remove_prompt_dir(prompt_dir: Path) -> None:
+        """
+        Remove a prompt folder with the known two-level layout.
+        
+        Unlinks the files in versions/ and the prompt folder directly; anything
+        unexpected (such as nested folders) falls back to shutil.rmtree. A
+        symlinked prompt folder is refused before anything is removed, as
+        shutil.rmtree does, so files outside the workspace are never touched.
+        """
+        if os.path.islink(prompt_dir):
+            raise OSError(f"Refusing to delete symlinked prompt folder: {prompt_dir}")
+        try:
+            with os.scandir(prompt_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        with os.scandir(entry.path) as sub_entries:
+                            for sub_entry in sub_entries:
+                                os.unlink(sub_entry.path)
+                        os.rmdir(entry.path)
+                    else:
+                        os.unlink(entry.path)
+            os.rmdir(prompt_dir)
+        except OSError:
+            import shutil
+            shutil.rmtree(prompt_dir)
+    
     def delete_prompt(self, prompt_id: str) -> bool:
         """Delete a prompt by ID."""
         try:
             prompt_dir = self.prompts_dir / prompt_id
             if prompt_dir.exists():
-                import shutil
-                shutil.rmtree(prompt_dir)
+                self._remove_prompt_dir(prompt_dir)
                 return True
             return False
         except Exception as e:
             print(f"Error deleting prompt {prompt_id}: {e}")
             return False
     
+    def _load_metadata_only(self, prompt_dir: Path) -> Optional[Dict]:
+        """Load only the metadata of a prompt, without reading any templates."""
+        try:
+            config_data = self._read_config(prompt_dir)
+            if config_data is None:
+                return None
+            
+            metadata = config_data.get("metadata") or {}
+            return {
+                "id": prompt_dir.name,
+                "name": metadata.get("name", prompt_dir.name),
+                "description": metadata.get("description", ""),
+                "created_at": metadata.get("created_at", ""),
+                "last_modified": metadata.get("last_modified", "")
+            }
+        
+        except Exception as e:
+            print(f"Warning: Error loading metadata from {prompt_dir}: {e}")
+            return None
+    
     def get_recent_prompts(self, limit: int = 5) -> List[Dict]:
         """Get recent prompts sorted by last modified date."""
-        prompts = self.load_prompts()
-        # Filter out the schema key
-        prompt_dict = {k: v for k, v in prompts.items() if k != "schema"}
-        sorted_prompts = sorted(
-            [{'id': k, **v} for k, v in prompt_dict.items()],
-            key=lambda x: x.get('last_modified', ''),
-            reverse=True
-        )
-        return sorted_prompts[:limit]
+        if not self._prompts_dir_exists():
+            return []
+        
+        # Only config.yaml is needed to order prompts, so skip the template reads
+        prompts = []
+        try:
+            with os.scandir(self.prompts_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    prompt_meta = self._load_metadata_only(Path(entry.path))
+                    if prompt_meta:
+                        prompts.append(prompt_meta)
+        except FileNotFoundError:
+            self._prompts_dir_verified = False
+            return []
+        
+        # Only the newest `limit` prompts are needed, so avoid sorting them all
+        return heapq.nlargest(limit, prompts, key=lambda x: x.get('last_modified', ''))
     
     def create_new_prompt(self, name: str, description: str = "") -> str:
         """Create a new prompt and return its ID."""
         # Generate unique ID based on name
-        prompt_id = name.lower().replace(" ", "_").replace("-", "_")
+        prompt_id = name.translate(_PROMPT_ID_TABLE).lower()
+        
+        # Ensure unique ID, checking against a single listing of the prompts directory.
+        # Compare casefolded names so "Alpha" still blocks "alpha" on
+        # case-insensitive filesystems (macOS, Windows).
+        try:
+            with os.scandir(self.prompts_dir) as entries:
+                existing_ids = {entry.name.casefold() for entry in entries}
+        except FileNotFoundError:
+            existing_ids = set()
         
-        # Ensure unique ID
         counter = 1
         original_id = prompt_id
-        while (self.prompts_dir / prompt_id).exists():
+        while prompt_id.casefold() in existing_ids:
             prompt_id = f"{original_id}_{counter}"
             counter += 1
         
-        current_time = datetime.now().isoformat()
+        current_time = _now_iso()
         
         # Create prompt data structure
         prompt_data = {
@@ -467,17 +744,32 @@ class FolderBasedPromptManager:
         self.save_prompt(prompt_id, prompt_data)
         return prompt_id
     
+    def _rewrite_last_modified(self, prompt_dir: Path, timestamp: str,
+                               live_version: Optional[Dict] = None) -> None:
+        """Update last_modified in config.yaml, and the live config/schema if given."""
+        config_data = self._read_config(prompt_dir) or {}
+        
+        config_data.setdefault("metadata", {})["last_modified"] = timestamp
+        
+        if live_version is not None:
+            config_data["schema"] = live_version.get("schema", {})
+            config_data["config"] = {
+                k: v for k, v in live_version.get("config", {}).items()
+                if k != "system_instruction"
+            }
+        
+        self._write_config(prompt_dir, config_data)
+    
     def add_version(self, prompt_id: str, version: str, content: Dict):
         """Add a new version to a prompt."""
         try:
-            prompt = self.get_prompt(prompt_id)
-            if not prompt:
+            # Only the new version file and config.yaml need touching, so avoid
+            # loading and rewriting every existing version of the prompt
+            prompt_dir = self.prompts_dir / prompt_id
+            if not (prompt_dir / "config.yaml").exists():
                 raise ValueError(f"Prompt with ID {prompt_id} not found")
             
-            if 'versions' not in prompt:
-                prompt['versions'] = {}
-            
-            current_time = datetime.now().isoformat()
+            current_time = _now_iso()
             
             # Ensure version has required structure
             if 'config' not in content:
@@ -510,16 +802,23 @@ class FolderBasedPromptManager:
                     "additionalProperties": False
                 }
             
-            # Update the version
-            prompt['versions'][version] = content
-            prompt['last_modified'] = current_time
+            # Write the new version file
+            versions_dir = prompt_dir / "versions"
+            versions_dir.mkdir(exist_ok=True)
+            system_instruction = content["config"].get("system_instruction", "")
+            self._write_if_changed(versions_dir / f"{version}.md", system_instruction)
+            
+            # Promote to current.md only when the new version is live
+            is_live = content.get('is_live', False)
+            if is_live:
+                self._write_if_changed(prompt_dir / "current.md", system_instruction)
             
-            # Save the updated prompt
-            self.save_prompt(prompt_id, prompt)
+            self._rewrite_last_modified(prompt_dir, current_time, content if is_live else None)
             
             return True
             
         except Exception as e:
             print(f"Error in add_version: {str(e)}")
+            import traceback
             print(traceback.format_exc())
             raise
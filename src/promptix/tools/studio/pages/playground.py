@@ -1,11 +1,64 @@
 import streamlit as st
 import json
-from typing import Optional, Dict, Any, List
+import hashlib
+import os
+from typing import Optional, Dict, Any, List, Tuple
 from promptix.tools.studio.data import PromptManager
 import traceback
 from datetime import datetime
 import re
 
+# Options and defaults for the Model Config section
+MODEL_OPTIONS = ["gpt-4o", "gpt-3.5-turbo", "gpt-4-turbo", "claude-3-5-sonnet", "claude-3-opus", "mistral-large", "mistral-medium"]
+PROVIDER_OPTIONS = ["openai", "anthropic", "mistral", "custom"]
+MODEL_CONFIG_DEFAULTS = {
+    "model": "gpt-4o",
+    "provider": "openai",
+    "temperature": 0.7,
+    "max_tokens": 1024,
+    "top_p": 1.0,
+    "frequency_penalty": 0.0,
+}
+_MODEL_INDEX = {model: i for i, model in enumerate(MODEL_OPTIONS)}
+_PROVIDER_INDEX = {provider: i for i, provider in enumerate(PROVIDER_OPTIONS)}
+
+# Default Jinja template that renders the enabled tools, and the config used when none is set
+DEFAULT_TOOLS_TEMPLATE = "{% raw %}{% set combined_tools = [] %}{% for tool_name, tool_config in tools.items() %}{% if use_%s|replace({'%s': tool_name}) %}{% set combined_tools = combined_tools + [{'name': tool_name, 'description': tool_config.description, 'parameters': tool_config.parameters}] %}{% endif %}{% endfor %}{{ combined_tools | tojson }}{% endraw %}"
+DEFAULT_TOOLS_CONFIG = {
+    "tools_template": DEFAULT_TOOLS_TEMPLATE,
+    "tools": {}
+}
+
+# Widget keys of the schema editor's "Add New Variable" form, cleared after saving
+NEW_VAR_INPUT_KEYS = ("new_var_name", "new_var_type", "new_var_required", "new_var_description")
+
+# Rows shown per page in the schema editor's "Current Variables" table
+SCHEMA_VARS_PAGE_SIZE = 25
+
+@st.cache_resource
+def _get_prompt_manager() -> PromptManager:
+    """Get a PromptManager shared across reruns."""
+    return PromptManager()
+
+@st.cache_data(ttl=60)
+def _load_prompt(prompt_id: str, mtime: float) -> Optional[Dict[str, Any]]:
+    """Load a prompt, cached until any of its files change (mtime is the cache key)."""
+    return _get_prompt_manager().get_prompt(prompt_id)
+
+def _payload_digest(payload: Any) -> str:
+    """Cheap fingerprint of a JSON-like payload, used as a cache key."""
+    # repr() runs in C and, like json.dumps, depends on key order
+    return hashlib.blake2b(repr(payload).encode("utf-8"), digest_size=8).hexdigest()
+
+@st.cache_data(max_entries=128)
+def _dumps_indent(obj_hash: str, _payload: Any) -> str:
+    """Pretty-print a payload as JSON, memoized on its digest (_payload is not hashed)."""
+    return json.dumps(_payload, indent=2)
+
+def _to_pretty_json(payload: Any) -> str:
+    """Pretty-print a payload as JSON, reusing the result across reruns."""
+    return _dumps_indent(_payload_digest(payload), payload)
+
 def render_model_config(config: Dict[str, Any] = None):
     """Render model configuration section"""
     st.subheader("Model Configuration")
@@ -13,30 +66,20 @@ def render_model_config(config: Dict[str, Any] = None):
     if not config:
         config = {}
     
-    # Define options lists
-    model_options = ["gpt-4o", "gpt-3.5-turbo", "gpt-4-turbo", "claude-3-5-sonnet", "claude-3-opus", "mistral-large", "mistral-medium"]
-    provider_options = ["openai", "anthropic", "mistral", "custom"]
-    
     # Get current values from config
-    current_model = config.get("model", "gpt-4o")
-    current_provider = config.get("provider", "openai")
+    current_model, current_provider, current_temperature, current_max_tokens, current_top_p, current_frequency_penalty = (
+        config.get(key, default) for key, default in MODEL_CONFIG_DEFAULTS.items()
+    )
     
-    # Find indices of current values
-    try:
-        model_index = model_options.index(current_model)
-    except ValueError:
-        model_index = 0  # Default to first option if not found
-        
-    try:
-        provider_index = provider_options.index(current_provider)
-    except ValueError:
-        provider_index = 0  # Default to first option if not found
+    # Find indices of current values, defaulting to the first option if not found
+    model_index = _MODEL_INDEX.get(current_model, 0)
+    provider_index = _PROVIDER_INDEX.get(current_provider, 0)
     
     col1, col2 = st.columns(2)
     with col1:
         model = st.selectbox(
             "Model",
-            model_options,
+            MODEL_OPTIONS,
             index=model_index,
             key="model_selector"
         )
@@ -44,7 +87,7 @@ def render_model_config(config: Dict[str, Any] = None):
     with col2:
         provider = st.selectbox(
             "Provider",
-            provider_options,
+            PROVIDER_OPTIONS,
             index=provider_index,
             key="provider_selector"
         )
@@ -55,7 +98,7 @@ def render_model_config(config: Dict[str, Any] = None):
             "Temperature",
             min_value=0.0,
             max_value=2.0,
-            value=config.get("temperature", 0.7),
+            value=float(current_temperature),
             step=0.1,
             key="temp_slider"
         )
@@ -65,7 +108,7 @@ def render_model_config(config: Dict[str, Any] = None):
             "Max Tokens",
             min_value=1,
             max_value=32000,
-            value=config.get("max_tokens", 1024),
+            value=int(current_max_tokens),
             key="tokens_input"
         )
     
@@ -75,7 +118,7 @@ def render_model_config(config: Dict[str, Any] = None):
             "Top P",
             min_value=0.0,
             max_value=1.0,
-            value=config.get("top_p", 1.0),
+            value=float(current_top_p),
             step=0.01,
             key="top_p_slider"
         )
@@ -85,7 +128,7 @@ def render_model_config(config: Dict[str, Any] = None):
             "Frequency Penalty",
             min_value=-2.0,
             max_value=2.0,
-            value=config.get("frequency_penalty", 0.0),
+            value=float(current_frequency_penalty),
             step=0.1,
             key="freq_penalty_slider"
         )
@@ -99,17 +142,38 @@ def render_model_config(config: Dict[str, Any] = None):
         "frequency_penalty": frequency_penalty
     }
 
+@st.cache_data(max_entries=128)
+def _build_vars_html(required_vars: tuple, optional_vars: tuple, var_types: tuple) -> str:
+    """Build the horizontal "Available Variables" banner HTML."""
+    types = dict(var_types)
+    var_items = []
+    
+    # Add required variables with styling
+    for var_name in required_vars:
+        var_type = types.get(var_name, "string")
+        var_items.append(f"<span style='background-color: rgba(255,255,255,0.1); padding: 3px 6px; margin: 2px; border-radius: 4px; display: inline-block;'>{{{{ <b>{var_name}</b> }}}} <small>({var_type})</small></span>")
+    
+    # Add optional variables with styling
+    for var_name in optional_vars:
+        var_type = types.get(var_name, "string")
+        var_items.append(f"<span style='background-color: rgba(255,255,255,0.1); padding: 3px 6px; margin: 2px; border-radius: 4px; display: inline-block;'>{{{{ <i>{var_name}</i> }}}} <small>({var_type})</small></span>")
+    
+    # Join items with spaces to keep them horizontal
+    return " ".join(var_items)
+
 def render_system_prompt(system_instruction: str = "You are a helpful AI assistant."):
     """Render system prompt section"""
-    # Replace escaped newlines with actual newlines for editing
-    if system_instruction:
-        if isinstance(system_instruction, str) and "\\n" in system_instruction:
-            system_instruction = system_instruction.replace("\\n", "\n")
+    # Replace escaped newlines with actual newlines for editing, once per prompt version
+    instruction_key = (st.session_state.get("prompt_id"), st.session_state.get("version_id"))
+    if st.session_state.get("system_instruction_key") != instruction_key:
+        st.session_state.system_instruction_key = instruction_key
+        st.session_state.system_instruction_normalized = (system_instruction or "").replace("\\n", "\n")
+    system_instruction = st.session_state.system_instruction_normalized
     
     # Get schema variables from session state if available
     schema_properties = {}
-    schema_required = []
-    schema_optional = []
+    schema_required = set()
+    schema_optional = set()
     
     if "schema_properties" in st.session_state:
         schema_properties = st.session_state.schema_properties
@@ -125,24 +189,13 @@ def render_system_prompt(system_instruction: str = "You are a helpful AI assista
         # st.info("Not Required: No Dynamic variable available, please add some variables to the schema.")
         st.info("✨ Define variables in the Schema tab to make your system instruction dynamic! (Not Required)")
     else:
-        # Create horizontal display of variables
-        var_items = []
-        
-        # Add required variables with styling
-        for var_name in schema_required:
-            var_props = schema_properties.get(var_name, {})
-            var_type = var_props.get("type", "string")
-            var_items.append(f"<span style='background-color: rgba(255,255,255,0.1); padding: 3px 6px; margin: 2px; border-radius: 4px; display: inline-block;'>{{{{ <b>{var_name}</b> }}}} <small>({var_type})</small></span>")
-        
-        # Add optional variables with styling
-        for var_name in schema_optional:
-            var_props = schema_properties.get(var_name, {})
-            var_type = var_props.get("type", "string")
-            var_items.append(f"<span style='background-color: rgba(255,255,255,0.1); padding: 3px 6px; margin: 2px; border-radius: 4px; display: inline-block;'>{{{{ <i>{var_name}</i> }}}} <small>({var_type})</small></span>")
-        
-        if var_items:
-            # Join items with spaces to keep them horizontal
-            vars_html = " ".join(var_items)
+        # Build the banner from an immutable snapshot so reruns hit the cache
+        var_types = tuple(sorted(
+            (var_name, var_props.get("type", "string"))
+            for var_name, var_props in schema_properties.items()
+        ))
+        vars_html = _build_vars_html(tuple(sorted(schema_required)), tuple(sorted(schema_optional)), var_types)
+        if vars_html:
             # Use markdown to display the HTML with proper styling
             st.markdown(f"<div style='background-color: rgba(30,30,30,0.6); padding: 10px; border-radius: 5px; overflow-x: auto; white-space: nowrap;'>{vars_html}</div>", unsafe_allow_html=True)
     
@@ -156,9 +209,67 @@ def render_system_prompt(system_instruction: str = "You are a helpful AI assista
         height=300,
         key="system_instruction_input"
     )
+    # Remember the edited text so it survives the section being hidden
+    st.session_state.system_instruction_normalized = system_text
     
     return system_text
 
+def _ensure_schema_state(prompt_id: Optional[str], version_id: Optional[str], schema: Optional[Dict[str, Any]]):
+    """Load a version's schema into session state, once per (prompt_id, version_id)."""
+    if st.session_state.get("_schema_key") == (prompt_id, version_id):
+        return
+    
+    schema = schema or {}
+    st.session_state.schema_properties = schema.get("properties", {})
+    st.session_state.schema_required = set(schema.get("required", []))
+    st.session_state.schema_optional = set(schema.get("optional", []))
+    st.session_state.schema_additional_props = schema.get("additionalProperties", False)
+    st.session_state.schema_changes = False
+    st.session_state.schema_page = 0
+    st.session_state.pop("edit_var", None)
+    st.session_state._all_vars_ver = st.session_state.get("_all_vars_ver", 0) + 1
+    st.session_state._schema_key = (prompt_id, version_id)
+
+def _mark_schema_vars_changed():
+    """Flag unsaved schema edits and invalidate the cached variable list."""
+    st.session_state.schema_changes = True
+    st.session_state._all_vars_ver = st.session_state.get("_all_vars_ver", 0) + 1
+
+def _get_schema_vars():
+    """Return the sorted variable names, recomputing them only after schema edits."""
+    ver = st.session_state.get("_all_vars_ver", 0)
+    if st.session_state.get("_all_vars_cache_ver") != ver:
+        st.session_state._all_vars_cache = sorted(
+            st.session_state.schema_required.union(
+                st.session_state.schema_optional, st.session_state.schema_properties
+            )
+        )
+        st.session_state._all_vars_cache_ver = ver
+    return st.session_state._all_vars_cache
+
+def _validate_schema_json(schema_json: str) -> Tuple[Optional[str], Optional[str]]:
+    """Validate the JSON editor text, returning (level, message) or (None, None) when valid."""
+    text_hash = hash(schema_json)
+    cached = st.session_state.get("_schema_json_cache")
+    if cached is not None and cached[0] == text_hash:
+        return cached[1]
+    
+    try:
+        json_schema = json.loads(schema_json)
+        if not isinstance(json_schema, dict):
+            result = ("error", "Schema must be a JSON object")
+        elif "properties" not in json_schema:
+            result = ("warning", "Schema should include a 'properties' object")
+        elif "required" not in json_schema and "optional" not in json_schema:
+            result = ("warning", "Schema should include 'required' or 'optional' arrays")
+        else:
+            result = (None, None)
+    except json.JSONDecodeError as e:
+        result = ("error", f"Invalid JSON: {str(e)}")
+    
+    st.session_state._schema_json_cache = (text_hash, result)
+    return result
+
 def render_schema_editor(schema: Dict[str, Any] = None):
     """Render schema editor for validation"""
     # st.subheader("Schema Validation")
@@ -182,25 +293,8 @@ def render_schema_editor(schema: Dict[str, Any] = None):
         🛠️ **Advanced usage**: Schema variables are particularly useful for building dynamic prompts with the builder interface.
         """)
     
-    if not schema:
-        schema = {
-            "required": [],
-            "optional": [],
-            "properties": {},
-            "additionalProperties": False
-        }
-    
-    # Initialize state variables if they don't exist
-    if "schema_changes" not in st.session_state:
-        st.session_state.schema_changes = False
-    if "schema_properties" not in st.session_state:
-        st.session_state.schema_properties = schema.get("properties", {})
-    if "schema_required" not in st.session_state:
-        st.session_state.schema_required = schema.get("required", [])
-    if "schema_optional" not in st.session_state:
-        st.session_state.schema_optional = schema.get("optional", [])
-    if "schema_additional_props" not in st.session_state:
-        st.session_state.schema_additional_props = schema.get("additionalProperties", False)
+    # Initialize state variables (a no-op when render_playground already did)
+    _ensure_schema_state(st.session_state.get("prompt_id"), st.session_state.get("version_id"), schema)
     
     # Create tabs for different editing modes
     schema_tab1, schema_tab2 = st.tabs(["Visual Editor", "JSON Editor"])
@@ -225,8 +319,8 @@ def render_schema_editor(schema: Dict[str, Any] = None):
             st.session_state.schema_additional_props = additional_props
             st.session_state.schema_changes = True
         
-        # Combined list of all variables (required + optional)
-        all_vars = sorted(set(required_vars + optional_vars + list(properties.keys())))
+        # Combined list of all variables (required + optional), cached between edits
+        all_vars = _get_schema_vars()
         
         # Add new variable section
         st.markdown("#### Add New Variable")
@@ -252,29 +346,33 @@ def render_schema_editor(schema: Dict[str, Any] = None):
             ```
             """)
         
-        col1, col2, col3 = st.columns([2, 2, 1])
-        with col1:
-            new_var_name = st.text_input("Variable Name", key="new_var_name", placeholder="e.g., user_query, customer_name")
-        with col2:
-            new_var_type = st.selectbox(
-                "Type", 
-                ["string", "number", "boolean", "object", "array"], 
-                key="new_var_type",
-                help="The data type expected for this variable"
+        # Batch the inputs in a form so typing doesn't rerun the whole page
+        with st.form("add_var_form", clear_on_submit=True, border=False):
+            col1, col2, col3 = st.columns([2, 2, 1])
+            with col1:
+                new_var_name = st.text_input("Variable Name", key="new_var_name", placeholder="e.g., user_query, customer_name")
+            with col2:
+                new_var_type = st.selectbox(
+                    "Type", 
+                    ["string", "number", "boolean", "object", "array"], 
+                    key="new_var_type",
+                    help="The data type expected for this variable"
+                )
+            with col3:
+                new_var_required = st.checkbox("Required", key="new_var_required", value=True, 
+                                             help="If checked, this variable must be provided when using the prompt")
+        
+            new_var_description = st.text_area(
+                "Description", 
+                key="new_var_description", 
+                placeholder="What is this variable for? e.g., 'The user's question' or 'Customer's full name'",
+                height=100
             )
-        with col3:
-            new_var_required = st.checkbox("Required", key="new_var_required", value=True, 
-                                         help="If checked, this variable must be provided when using the prompt")
         
-        new_var_description = st.text_area(
-            "Description", 
-            key="new_var_description", 
-            placeholder="What is this variable for? e.g., 'The user's question' or 'Customer's full name'",
-            height=100
-        )
+            # Add variable button
+            submitted = st.form_submit_button("Add Variable", use_container_width=True)
         
-        # Add variable button
-        if st.button("Add Variable", key="add_var_btn", use_container_width=True):
+        if submitted:
             if new_var_name and new_var_name.strip():
                 var_name = new_var_name.strip()
                 
@@ -286,21 +384,14 @@ def render_schema_editor(schema: Dict[str, Any] = None):
                 
                 # Add to required or optional list
                 if new_var_required:
-                    if var_name not in required_vars:
-                        required_vars.append(var_name)
-                    if var_name in optional_vars:
-                        optional_vars.remove(var_name)
+                    required_vars.add(var_name)
+                    optional_vars.discard(var_name)
                 else:
-                    if var_name not in optional_vars:
-                        optional_vars.append(var_name)
-                    if var_name in required_vars:
-                        required_vars.remove(var_name)
-                        
-                # Update all_vars
-                all_vars = sorted(set(required_vars + optional_vars + list(properties.keys())))
+                    optional_vars.add(var_name)
+                    required_vars.discard(var_name)
                 
                 # Mark that changes were made
-                st.session_state.schema_changes = True
+                _mark_schema_vars_changed()
                 
                 st.success(f"Added variable: {var_name}")
                 # We will not directly clear the session state, instead we'll use a rerun
@@ -311,82 +402,98 @@ def render_schema_editor(schema: Dict[str, Any] = None):
             st.markdown("---")
             st.markdown("#### Current Variables")
             
-            # Table header
-            col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
-            with col1:
-                st.markdown("**Variable Name**")
-            with col2:
-                st.markdown("**Type**")
-            with col3:
-                st.markdown("**Status**")
-            with col4:
-                st.markdown("**Actions**")
+            # Only render one page of rows so the widget count per rerun stays bounded
+            page_count = (len(all_vars) - 1) // SCHEMA_VARS_PAGE_SIZE + 1
+            page = min(st.session_state.get("schema_page", 0), page_count - 1)
+            if page_count > 1:
+                page = st.number_input(
+                    "Page",
+                    min_value=1,
+                    max_value=page_count,
+                    value=page + 1,
+                    key="schema_page_input",
+                    help=f"{len(all_vars)} variables, {SCHEMA_VARS_PAGE_SIZE} per page"
+                ) - 1
+            st.session_state.schema_page = page
+            start = page * SCHEMA_VARS_PAGE_SIZE
+            visible_vars = all_vars[start:start + SCHEMA_VARS_PAGE_SIZE]
             
-            # Create rows for each variable
-            for var_name in all_vars:
-                col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
-                
-                with col1:
-                    st.text(var_name)
-                
-                with col2:
+            # One data editor for the whole page; the Edit/Delete checkbox columns are the actions
+            edit_var = st.session_state.get("edit_var")
+            rows = []
+            for var_name in visible_vars:
+                if var_name in required_vars:
+                    status = "🔴 Required"
+                elif var_name in optional_vars:
+                    status = "🟢 Optional"
+                else:
+                    status = "⚪ Undefined"
+                rows.append({
+                    "Variable Name": var_name,
+                    "Type": properties.get(var_name, {}).get("type", "string"),
+                    "Status": status,
+                    "Edit": var_name == edit_var,
+                    "Delete": False,
+                })
+            
+            # The key changes with the schema and edit target so the checkboxes start fresh
+            edited_rows = st.data_editor(
+                rows,
+                key=f"schema_vars_editor_{st.session_state.get('_all_vars_ver', 0)}_{page}_{edit_var}",
+                num_rows="fixed",
+                disabled=["Variable Name", "Type", "Status"],
+                hide_index=True,
+                use_container_width=True
+            )
+            
+            for row in edited_rows:
+                var_name = row["Variable Name"]
+                if row["Delete"]:
+                    # Remove from all lists
+                    required_vars.discard(var_name)
+                    optional_vars.discard(var_name)
                     if var_name in properties:
-                        var_type = properties[var_name].get("type", "string")
-                        st.text(var_type)
-                    else:
-                        st.text("string")
-                
-                with col3:
-                    if var_name in required_vars:
-                        st.markdown("🔴 Required")
-                    elif var_name in optional_vars:
-                        st.markdown("🟢 Optional")
-                    else:
-                        st.markdown("⚪ Undefined")
-                
-                with col4:
-                    if st.button("✏️", key=f"edit_{var_name}"):
+                        del properties[var_name]
+                    if edit_var == var_name:
+                        del st.session_state["edit_var"]
+                    _mark_schema_vars_changed()
+                    st.success(f"Removed variable: {var_name}")
+                    st.rerun()
+                if row["Edit"] != (var_name == edit_var):
+                    if row["Edit"]:
                         st.session_state["edit_var"] = var_name
-                    if st.button("🗑️", key=f"delete_{var_name}"):
-                        # Remove from all lists
-                        if var_name in required_vars:
-                            required_vars.remove(var_name)
-                        if var_name in optional_vars:
-                            optional_vars.remove(var_name)
-                        if var_name in properties:
-                            del properties[var_name]
-                        st.session_state.schema_changes = True
-                        st.success(f"Removed variable: {var_name}")
-                        st.rerun()
-                
-                # If this variable is being edited
-                if st.session_state.get("edit_var") == var_name:
-                    with st.expander(f"Edit {var_name}", expanded=True):
-                        var_props = properties.get(var_name, {"type": "string", "description": ""})
-                        
-                        edit_col1, edit_col2 = st.columns([2, 2])
-                        with edit_col1:
-                            edited_type = st.selectbox(
-                                "Type", 
-                                ["string", "number", "boolean", "object", "array"],
-                                index=["string", "number", "boolean", "object", "array"].index(var_props.get("type", "string")),
-                                key=f"edit_type_{var_name}"
-                            )
-                        
-                        with edit_col2:
-                            edited_required = st.checkbox(
-                                "Required", 
-                                value=var_name in required_vars,
-                                key=f"edit_required_{var_name}"
-                            )
-                        
+                    else:
+                        del st.session_state["edit_var"]
+                    st.rerun()
+            
+            # If a variable on this page is being edited
+            var_name = st.session_state.get("edit_var")
+            if var_name in visible_vars:
+                with st.expander(f"Edit {var_name}", expanded=True):
+                    var_props = properties.get(var_name, {"type": "string", "description": ""})
+                    
+                    # The type stays outside the form so its configuration fields update immediately
+                    edited_type = st.selectbox(
+                        "Type", 
+                        ["string", "number", "boolean", "object", "array"],
+                        index=["string", "number", "boolean", "object", "array"].index(var_props.get("type", "string")),
+                        key=f"edit_type_{var_name}"
+                    )
+                    
+                    with st.form(f"edit_var_form_{var_name}", border=False):
+                        edited_required = st.checkbox(
+                            "Required", 
+                            value=var_name in required_vars,
+                            key=f"edit_required_{var_name}"
+                        )
+                    
                         edited_description = st.text_area(
                             "Description",
                             value=var_props.get("description", ""),
                             key=f"edit_desc_{var_name}",
                             height=100
                         )
-                        
+                    
                         # Example section based on type
                         if edited_type == "string":
                             st.markdown("#### String Configuration")
@@ -407,7 +514,7 @@ def render_schema_editor(schema: Dict[str, Any] = None):
                                 value=var_props.get("pattern", ""),
                                 key=f"pattern_{var_name}"
                             )
-                        
+                    
                         elif edited_type == "number":
                             st.markdown("#### Number Configuration")
                             minimum = st.number_input(
@@ -420,14 +527,14 @@ def render_schema_editor(schema: Dict[str, Any] = None):
                                 value=var_props.get("maximum", 0.0),
                                 key=f"maximum_{var_name}"
                             )
-                        
+                    
                         # Save and cancel buttons
                         save_col1, save_col2 = st.columns(2)
                         with save_col1:
-                            if st.button("Save Changes", key=f"save_{var_name}", use_container_width=True):
+                            if st.form_submit_button("Save Changes", use_container_width=True):
                                 # Update property
                                 updated_props = {"type": edited_type, "description": edited_description}
-                                
+                            
                                 # Add type-specific properties
                                 if edited_type == "string":
                                     if min_length > 0:
@@ -441,33 +548,29 @@ def render_schema_editor(schema: Dict[str, Any] = None):
                                         updated_props["minimum"] = minimum
                                     if maximum != 0.0:
                                         updated_props["maximum"] = maximum
-                                
+                            
                                 properties[var_name] = updated_props
-                                
+                            
                                 # Update required/optional status
                                 if edited_required:
-                                    if var_name not in required_vars:
-                                        required_vars.append(var_name)
-                                    if var_name in optional_vars:
-                                        optional_vars.remove(var_name)
+                                    required_vars.add(var_name)
+                                    optional_vars.discard(var_name)
                                 else:
-                                    if var_name not in optional_vars:
-                                        optional_vars.append(var_name)
-                                    if var_name in required_vars:
-                                        required_vars.remove(var_name)
-                                
+                                    optional_vars.add(var_name)
+                                    required_vars.discard(var_name)
+                            
                                 # Mark that changes were made
-                                st.session_state.schema_changes = True
-                                
+                                _mark_schema_vars_changed()
+                            
                                 # Clear edit state
                                 if "edit_var" in st.session_state:
                                     del st.session_state["edit_var"]
-                                    
+                                
                                 st.success(f"Updated variable: {var_name}")
                                 st.rerun()
-                        
+                    
                         with save_col2:
-                            if st.button("Cancel", key=f"cancel_{var_name}", use_container_width=True):
+                            if st.form_submit_button("Cancel", use_container_width=True):
                                 if "edit_var" in st.session_state:
                                     del st.session_state["edit_var"]
                                 st.rerun()
@@ -480,45 +583,41 @@ def render_schema_editor(schema: Dict[str, Any] = None):
         
         # Create the schema object from the session state
         schema_obj = {
-            "required": st.session_state.schema_required,
-            "optional": st.session_state.schema_optional,
+            "required": sorted(st.session_state.schema_required),
+            "optional": sorted(st.session_state.schema_optional),
             "properties": st.session_state.schema_properties,
             "additionalProperties": st.session_state.schema_additional_props
         }
         
         schema_json = st.text_area(
             "Schema JSON",
-            value=json.dumps(schema_obj, indent=2),
+            value=_to_pretty_json(schema_obj),
             height=400,
             key="schema_json_editor"
         )
         
-        try:
-            json_schema = json.loads(schema_json)
-            # Basic validation
-            if not isinstance(json_schema, dict):
-                st.error("Schema must be a JSON object")
-            elif "properties" not in json_schema:
-                st.warning("Schema should include a 'properties' object")
-            elif "required" not in json_schema and "optional" not in json_schema:
-                st.warning("Schema should include 'required' or 'optional' arrays")
-            else:
-                # Apply the JSON editor changes to session state
-                if st.button("Apply JSON Changes", key="apply_json_schema", use_container_width=True):
-                    st.session_state.schema_properties = json_schema.get("properties", {})
-                    st.session_state.schema_required = json_schema.get("required", [])
-                    st.session_state.schema_optional = json_schema.get("optional", [])
-                    st.session_state.schema_additional_props = json_schema.get("additionalProperties", False)
-                    st.session_state.schema_changes = True
-                    st.success("Schema updated from JSON editor")
-                    st.rerun()
-        except json.JSONDecodeError as e:
-            st.error(f"Invalid JSON: {str(e)}")
+        # Basic validation, skipped when the text hasn't changed since the last rerun
+        level, message = _validate_schema_json(schema_json)
+        if level == "error":
+            st.error(message)
+        elif level == "warning":
+            st.warning(message)
+        else:
+            # Apply the JSON editor changes to session state
+            if st.button("Apply JSON Changes", key="apply_json_schema", use_container_width=True):
+                json_schema = json.loads(schema_json)
+                st.session_state.schema_properties = json_schema.get("properties", {})
+                st.session_state.schema_required = set(json_schema.get("required", []))
+                st.session_state.schema_optional = set(json_schema.get("optional", []))
+                st.session_state.schema_additional_props = json_schema.get("additionalProperties", False)
+                _mark_schema_vars_changed()
+                st.success("Schema updated from JSON editor")
+                st.rerun()
     
     # Return the current schema state
     return {
-        "required": st.session_state.schema_required,
-        "optional": st.session_state.schema_optional,
+        "required": sorted(st.session_state.schema_required),
+        "optional": sorted(st.session_state.schema_optional),
         "properties": st.session_state.schema_properties,
         "additionalProperties": st.session_state.schema_additional_props
     }
@@ -562,11 +661,7 @@ def format_template_for_display(template_str):
 def render_tools_config(tools_config: Dict[str, Any] = None):
     """Render tools configuration section"""
     
-    if not tools_config:
-        tools_config = {
-            "tools_template": "{% raw %}{% set combined_tools = [] %}{% for tool_name, tool_config in tools.items() %}{% if use_%s|replace({'%s': tool_name}) %}{% set combined_tools = combined_tools + [{'name': tool_name, 'description': tool_config.description, 'parameters': tool_config.parameters}] %}{% endif %}{% endfor %}{{ combined_tools | tojson }}{% endraw %}",
-            "tools": {}
-        }
+    tools_config = tools_config or DEFAULT_TOOLS_CONFIG
 
     # Add "How to Use" expander with information about tools
     with st.expander("How to Use", expanded=False):
@@ -639,7 +734,7 @@ def render_tools_config(tools_config: Dict[str, Any] = None):
                     
                     # Show parameters as formatted JSON
                     st.markdown("**Parameters:**")
-                    st.code(json.dumps(tool_data.get("parameters", {}), indent=2), language="json")
+                    st.code(_to_pretty_json(tool_data.get("parameters", {})), language="json")
                     
                     # Edit and delete buttons
                     col1, col2 = st.columns(2)
@@ -741,7 +836,7 @@ def render_tools_config(tools_config: Dict[str, Any] = None):
         # JSON editor for parameters
         st.markdown("##### Parameters (JSON Schema)")
         default_params = {"type": "object", "properties": {}, "required": []} if st.session_state.get("clear_tool_inputs", False) else tool_data.get("parameters", {"type": "object", "properties": {}, "required": []})
-        param_json = json.dumps(default_params, indent=2)
+        param_json = _to_pretty_json(default_params)
         
         # Use a unique key for the text area that changes when clear_tool_inputs is true
         text_area_key = "params_json_editor_cleared" if st.session_state.get("clear_tool_inputs", False) else "params_json_editor"
@@ -868,9 +963,9 @@ def render_playground():
         # Header with context
         st.title("Prompt Playground")
         
-        # Load prompt data
-        prompt_manager = PromptManager()
-        prompt = prompt_manager.get_prompt(prompt_id)
+        # Load prompt data, reusing the parsed prompt across widget reruns
+        prompt_manager = _get_prompt_manager()
+        prompt = _load_prompt(prompt_id, prompt_manager.get_prompt_mtime(prompt_id))
         if not prompt:
             st.error(f"Prompt not found: {prompt_id}")
             return
@@ -916,47 +1011,78 @@ def render_playground():
         # Log for debugging
         st.session_state["debug_version_data"] = version_data
         
-        # Initialize schema session state on first load
-        if "schema_properties" not in st.session_state:
-            schema = version_data.get("schema", {})
-            st.session_state.schema_properties = schema.get("properties", {})
-            st.session_state.schema_required = schema.get("required", [])
-            st.session_state.schema_optional = schema.get("optional", [])
-            st.session_state.schema_additional_props = schema.get("additionalProperties", False)
-            st.session_state.schema_changes = False
-        
-        # Configuration tabs - reduced from 5 to 4 tabs by removing the Test tab
-        tab1, tab2, tab3, tab4 = st.tabs([
-            "Model Config", "System Instruction", "Schema", "Tools Configuration"
-        ])
-        
-        # Process each tab
-        with tab1:
+        # Initialize schema session state for this prompt version
+        _ensure_schema_state(prompt_id, version_id, version_data.get("schema", {}))
+        
+        # Remember each section's latest values so hidden sections don't need to render
+        sections = st.session_state.get("playground_sections")
+        if not sections or sections.get("key") != (prompt_id, version_id):
+            version_config = version_data.get("config", {})
+            sections = {
+                "key": (prompt_id, version_id),
+                "config": {k: v for k, v in version_config.items() if k != "system_instruction"},
+                "system_instruction": version_config.get("system_instruction", "You are a helpful AI assistant."),
+                "tools_config": version_data.get("tools_config", None),
+                "tools_template": None,
+            }
+            st.session_state.playground_sections = sections
+        
+        # Configuration sections - st.tabs would run every tab body on each rerun,
+        # so only the selected section is rendered
+        active_section = st.radio(
+            "Section",
+            ["Model Config", "System Instruction", "Schema", "Tools Configuration"],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="playground_section"
+        )
+        
+        config = sections["config"]
+        system_instruction = sections["system_instruction"]
+        schema = {
+            "required": sorted(st.session_state.schema_required),
+            "optional": sorted(st.session_state.schema_optional),
+            "properties": st.session_state.schema_properties,
+            "additionalProperties": st.session_state.schema_additional_props
+        }
+        tools_config = sections["tools_config"]
+        
+        # Process the active section
+        if active_section == "Model Config":
             try:
-                config = render_model_config(version_data.get("config", {}))
+                config = render_model_config(sections["config"])
+                sections["config"] = config
             except Exception as e:
                 st.error(f"Error in Model Config tab: {str(e)}")
                 config = {}
         
-        with tab2:
+        elif active_section == "System Instruction":
             try:
-                system_instruction = render_system_prompt(
-                    version_data.get("config", {}).get("system_instruction", "You are a helpful AI assistant.")
-                )
+                system_instruction = render_system_prompt(sections["system_instruction"])
+                sections["system_instruction"] = system_instruction
             except Exception as e:
                 st.error(f"Error in System Instruction tab: {str(e)}")
                 system_instruction = "You are a helpful AI assistant."
         
-        with tab3:
+        elif active_section == "Schema":
             try:
                 schema = render_schema_editor(version_data.get("schema", {}))
             except Exception as e:
                 st.error(f"Error in Schema tab: {str(e)}")
                 schema = {"required": [], "optional": [], "properties": {}, "additionalProperties": False}
         
-        with tab4:
+        else:
             try:
-                tools_config = render_tools_config(version_data.get("tools_config", None))
+                version_tools_config = version_data.get("tools_config", None)
+                if sections["tools_template"] is not None:
+                    # Keep template edits made before the section was hidden
+                    version_tools_config = {
+                        **(version_tools_config or {}),
+                        "tools_template": sections["tools_template"]
+                    }
+                tools_config = render_tools_config(version_tools_config)
+                sections["tools_config"] = tools_config
+                sections["tools_template"] = tools_config["tools_template"]
             except Exception as e:
                 st.error(f"Error in Tools tab: {str(e)}")
                 tools_config = None
@@ -1012,20 +1138,22 @@ def render_playground():
                 st.session_state["clear_tool_inputs"] = True
                 
                 # Clear form input fields by resetting session state
-                for key in list(st.session_state.keys()):
-                    if key.startswith("new_var_"):
-                        del st.session_state[key]
+                for key in NEW_VAR_INPUT_KEYS:
+                    st.session_state.pop(key, None)
                 
-                # Verify the save worked
-                saved_prompt = prompt_manager.get_prompt(prompt_id)
-                if saved_prompt and version_id in saved_prompt.get('versions', {}):
-                    saved_config = saved_prompt['versions'][version_id]['config']
-                    st.session_state["debug_saved_config"] = saved_config
-                    # st.info(f"Saved successfully with model: {saved_config.get('model')} and provider: {saved_config.get('provider')}")
+                # save_prompt raises on failure, so the data in hand is what was written;
+                # re-reading it from disk is only done when debugging saves
+                saved_config = updated_version['config']
+                if os.environ.get("PROMPTIX_DEBUG_SAVE"):
+                    saved_prompt = prompt_manager.get_prompt(prompt_id)
+                    if saved_prompt and version_id in saved_prompt.get('versions', {}):
+                        saved_config = saved_prompt['versions'][version_id]['config']
+                st.session_state["debug_saved_config"] = saved_config
+                # st.info(f"Saved successfully with model: {saved_config.get('model')} and provider: {saved_config.get('provider')}")
 
-                    # Set success flag in session state instead of showing success message
-                    st.session_state["save_success"] = True
-                    st.rerun()  # Rerun to show the success message
+                # Set success flag in session state instead of showing success message
+                st.session_state["save_success"] = True
+                st.rerun()  # Rerun to show the success message
             except Exception as e:
                 st.error(f"Error saving changes: {str(e)}")
                 st.error(traceback.format_exc())
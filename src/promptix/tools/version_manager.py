@@ -9,15 +9,72 @@ Usage:
     python -m promptix.tools.version_manager [command] [args]
 """
 
-import argparse
+import copy
+import errno
 import os
-import shutil
 import sys
+import threading
 import yaml
-import re
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+
+# Parsed config.yaml files keyed by path, validated against (mtime_ns, size)
+_CONFIG_CACHE_SIZE = 100
+_config_cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_config_cache_lock = threading.Lock()
+
+# Chunk size used when streaming prompt templates between current.md and versions/
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _strip_version_header(content: str) -> str:
+    """Remove a leading '<!-- Version ... -->' line added by create_version"""
+    # Same match as re.sub(r'^<!-- Version.*? -->\r?\n', '', content), without the regex engine.
+    # The header may end in '\r\n' when create_version wrote it in text mode on Windows.
+    if content.startswith('<!-- Version'):
+        newline = content.find('\n')
+        header = content[:newline - 1] if content[newline - 1:newline] == '\r' else content[:newline]
+        if newline != -1 and header.endswith(' -->'):
+            return content[newline + 1:]
+    return content
+
+
+# copy_file_range errors that mean "not supported here" rather than a real I/O failure
+_COPY_FILE_RANGE_UNSUPPORTED = {errno.EINVAL, errno.ENOSYS, errno.EXDEV, errno.EOPNOTSUPP, errno.EPERM}
+
+
+def _copy_remaining(src, dst):
+    """Copy the rest of binary file src into dst, in-kernel via os.copy_file_range where available"""
+    dst.flush()
+    offset = src.tell()
+    if hasattr(os, 'copy_file_range'):
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        remaining = os.fstat(src_fd).st_size - offset
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining, offset)
+                if copied == 0:
+                    break
+                offset += copied
+                remaining -= copied
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+            # Continue in user space from wherever the kernel copy stopped
+            src.seek(offset)
+    
+    import shutil
+    shutil.copyfileobj(src, dst, length=_COPY_BUFFER_SIZE)
 
 
 class VersionManager:
@@ -131,16 +188,36 @@ class VersionManager:
     def find_agent_dirs(self) -> List[Path]:
         """Find all agent directories in prompts/"""
         agent_dirs = []
-        for item in self.prompts_dir.iterdir():
-            if item.is_dir() and (item / 'config.yaml').exists():
-                agent_dirs.append(item)
+        with os.scandir(self.prompts_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, 'config.yaml')):
+                    agent_dirs.append(Path(entry.path))
         return agent_dirs
     
     def load_config(self, config_path: Path) -> Optional[Dict[str, Any]]:
-        """Load YAML config file safely"""
+        """Load YAML config file safely, reusing the parsed result while the file is unchanged"""
         try:
+            key = str(config_path)
+            stat = os.stat(config_path)
+            with _config_cache_lock:
+                cached = _config_cache.get(key)
+                if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    _config_cache.move_to_end(key)
+                else:
+                    cached = None
+            if cached is not None:
+                # Callers mutate the returned config, so never hand out the cached object
+                return copy.deepcopy(cached[2])
+            
             with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+                config = yaml.load(f, Loader=_SafeLoader)
+            
+            with _config_cache_lock:
+                _config_cache[key] = (stat.st_mtime_ns, stat.st_size, config)
+                _config_cache.move_to_end(key)
+                if len(_config_cache) > _CONFIG_CACHE_SIZE:
+                    _config_cache.popitem(last=False)
+            return copy.deepcopy(config)
         except FileNotFoundError as e:
             self.print_status(f"Config file not found {config_path}: {e}", "error")
             return None
@@ -151,11 +228,31 @@ class VersionManager:
             self.print_status(f"YAML parsing error in {config_path}: {e}", "error")
             return None
     
+    def invalidate_config(self, config_path: Path):
+        """Drop a config file from the load_config cache"""
+        with _config_cache_lock:
+            _config_cache.pop(str(config_path), None)
+    
     def save_config(self, config_path: Path, config: Dict[str, Any]) -> bool:
         """Save YAML config file safely"""
+        config_path = Path(config_path)
+        tmp_path = config_path.with_name(f".{config_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
         try:
-            with open(config_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            data = yaml.dump(config, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+            
+            # Write to a sibling temp file in one go and swap it in so the config is never half-written
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, config_path)
+            except BaseException:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise
+            finally:
+                self.invalidate_config(config_path)
             return True
         except PermissionError as e:
             self.print_status(f"Permission denied writing to {config_path}: {e}", "error")
@@ -175,10 +272,15 @@ class VersionManager:
         self.print_status("Available agents:", "list")
         print()
         
-        for agent_dir in sorted(agent_dirs):
-            config_path = agent_dir / 'config.yaml'
-            config = self.load_config(config_path)
-            
+        # Load the configs concurrently, then print them in order
+        from concurrent.futures import ThreadPoolExecutor
+        
+        agent_dirs = sorted(agent_dirs)
+        config_paths = [agent_dir / 'config.yaml' for agent_dir in agent_dirs]
+        with ThreadPoolExecutor(max_workers=min(16, len(config_paths))) as executor:
+            configs = list(executor.map(self.load_config, config_paths))
+        
+        for agent_dir, config in zip(agent_dirs, configs):
             if config:
                 name = config.get('metadata', {}).get('name', agent_dir.name)
                 current_version = config.get('current_version', 'not set')
@@ -219,7 +321,11 @@ class VersionManager:
             self.print_status("No versions directory found", "warning")
             return
         
-        version_files = sorted(versions_dir.glob('v*.md'), key=lambda x: x.name)
+        with os.scandir(versions_dir) as entries:
+            version_files = sorted(
+                entry.name for entry in entries
+                if entry.name.startswith('v') and entry.name.endswith('.md')
+            )
         
         if not version_files:
             self.print_status("No versions found", "warning")
@@ -228,7 +334,7 @@ class VersionManager:
         version_info = config.get('versions', {})
         
         for version_file in version_files:
-            version_name = version_file.stem
+            version_name = version_file[:-3]
             is_current = version_name == current_version
             marker = " ← CURRENT" if is_current else ""
             
@@ -269,7 +375,7 @@ class VersionManager:
                 content = f.read()
             
             # Remove version header if present
-            content = re.sub(r'^<!-- Version.*? -->\n', '', content)
+            content = _strip_version_header(content)
             
             self.print_status(f"Content of {agent_name}/{version_name}:", "info")
             print("-" * 50)
@@ -326,16 +432,13 @@ class VersionManager:
             if not self.save_config(config_path, config):
                 return
             
-            # Deploy version to current.md
-            shutil.copy2(version_file, current_md)
-            
-            # Remove version header from current.md
-            with open(current_md, 'r') as f:
-                content = f.read()
-            
-            content = re.sub(r'^<!-- Version.*? -->\n', '', content)
-            with open(current_md, 'w') as f:
-                f.write(content)
+            # Deploy version to current.md, dropping the version header in flight
+            import shutil
+            with open(version_file, 'rb') as src, open(current_md, 'wb') as dst:
+                first_line = src.readline().decode('utf-8', 'surrogateescape')
+                dst.write(_strip_version_header(first_line).encode('utf-8', 'surrogateescape'))
+                _copy_remaining(src, dst)
+            shutil.copymode(version_file, current_md)
             
             self.print_status(f"Switched {agent_name} to {version_name}", "success")
             self.print_status(f"Updated current.md and config.yaml", "info")
@@ -377,16 +480,13 @@ class VersionManager:
         
         # Determine version name
         if not version_name:
-            # Auto-generate next version number
-            version_files = list(versions_dir.glob('v*.md'))
-            version_numbers = []
-            
-            for file in version_files:
-                match = re.match(r'v(\d+)\.md', file.name)
-                if match:
-                    version_numbers.append(int(match.group(1)))
-            
-            next_num = max(version_numbers) + 1 if version_numbers else 1
+            # Auto-generate next version number from the highest existing vNNN.md
+            next_num = 1
+            with os.scandir(versions_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('v') and name.endswith('.md') and name[1:-3].isdecimal():
+                        next_num = max(next_num, int(name[1:-3]) + 1)
             version_name = f'v{next_num:03d}'
         
         version_file = versions_dir / f'{version_name}.md'
@@ -401,24 +501,23 @@ class VersionManager:
             return
         
         try:
-            # Copy current.md to version file
-            shutil.copy2(current_md, version_file)
-            
-            # Add version header
-            with open(version_file, 'r') as f:
-                content = f.read()
+            # One timestamp for the header, the version entry and last_modified
+            now_iso = datetime.now().isoformat()
             
-            version_header = f"<!-- Version {version_name} - Created {datetime.now().isoformat()} -->\n"
-            with open(version_file, 'w') as f:
-                f.write(version_header)
-                f.write(content)
+            # Copy current.md to version file behind a version header
+            import shutil
+            version_header = f"<!-- Version {version_name} - Created {now_iso} -->\n"
+            with open(current_md, 'rb') as src, open(version_file, 'wb') as dst:
+                dst.write(version_header.encode('utf-8'))
+                _copy_remaining(src, dst)
+            shutil.copymode(current_md, version_file)
             
             # Update config
             if 'versions' not in config:
                 config['versions'] = {}
             
             config['versions'][version_name] = {
-                'created_at': datetime.now().isoformat(),
+                'created_at': now_iso,
                 'author': os.getenv('USER', 'unknown'),
                 'notes': notes
             }
@@ -429,7 +528,7 @@ class VersionManager:
             # Update metadata
             if 'metadata' not in config:
                 config['metadata'] = {}
-            config['metadata']['last_modified'] = datetime.now().isoformat()
+            config['metadata']['last_modified'] = now_iso
             
             # Save config
             if self.save_config(config_path, config):
@@ -445,6 +544,8 @@ class VersionManager:
 
 def main():
     """Main CLI entry point"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Promptix Version Manager - Manual version control for prompts"
     )
@@ -2,9 +2,9 @@
 Tests for the refactored architecture with dependency injection and focused components.
 """
 
+import re
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
 # Architecture refactor tests - now enabled since components are implemented!
 
@@ -31,45 +31,73 @@ from promptix.core.container import Container, reset_container
 from promptix.core.base import Promptix  # Use current implementation
 
 
+def _assert_contains(error, *needles):
+    """Assert that str(error) contains every needle, formatting the error only once."""
+    message = str(error)
+    missing = [needle for needle in needles if needle not in message]
+    assert not missing, f"missing {missing} in {message!r}"
+
+
+def _freeze(data):
+    """Wrap a dict (and any nested dicts) in read-only mapping proxies."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+    })
+
+
+# Version data shared by the lookup and config-builder tests; built once at import
+# and frozen so no test can leak mutations into another.
+_VERSIONS_ONE_LIVE = _freeze({"v1": {"is_live": False}, "v2": {"is_live": True}, "v3": {"is_live": False}})
+_VERSIONS_NONE_LIVE = _freeze({"v1": {"is_live": False}, "v2": {"is_live": False}})
+_VERSIONS_TWO_LIVE = _freeze({"v1": {"is_live": True}, "v2": {"is_live": True}})
+_VERSIONS_BY_MODEL = _freeze({"v1": {"config": {"model": "gpt-3.5-turbo"}}, "v2": {"config": {"model": "gpt-4"}}})
+_OPENAI_VERSION = _VERSIONS_BY_MODEL["v1"]
+_ANTHROPIC_VERSION = _freeze({"config": {"model": "claude-3-sonnet-20240229"}})
+_NO_MODEL_VERSION = _freeze({"config": {}})
+
+
 class TestExceptions:
     """Test the custom exception hierarchy."""
 
-    def test_promptix_error_base(self):
-        """Test the base PromptixError class."""
-        error = PromptixError("Test error", {"key": "value"})
-        assert str(error) == "Test error. Details: {'key': 'value'}"
-        assert error.message == "Test error"
-        assert error.details == {"key": "value"}
-
-    def test_prompt_not_found_error(self):
-        """Test PromptNotFoundError."""
-        error = PromptNotFoundError("TestPrompt", ["Prompt1", "Prompt2"])
-        assert "TestPrompt" in str(error)
-        assert error.details["prompt_name"] == "TestPrompt"
-        assert error.details["available_prompts"] == ["Prompt1", "Prompt2"]
-
-    def test_version_not_found_error(self):
-        """Test VersionNotFoundError."""
-        error = VersionNotFoundError("v2", "TestPrompt", ["v1", "v3"])
-        assert "v2" in str(error)
-        assert "TestPrompt" in str(error)
-        assert error.details["version"] == "v2"
-        assert error.details["prompt_name"] == "TestPrompt"
-
-    def test_variable_validation_error(self):
-        """Test VariableValidationError."""
-        error = VariableValidationError("TestPrompt", "test_var", "must be string", 123, "string")
-        assert "test_var" in str(error)
-        assert "TestPrompt" in str(error)
-        assert error.details["variable_name"] == "test_var"
-        assert error.details["provided_value"] == 123
-
-    def test_required_variable_error(self):
-        """Test RequiredVariableError."""
-        error = RequiredVariableError("TestPrompt", ["var1", "var2"], ["var3"])
-        assert "var1" in str(error)
-        assert "var2" in str(error)
-        assert error.details["missing_variables"] == ["var1", "var2"]
+    @pytest.mark.parametrize("exc_cls,args,expected_substrings,expected_details", [
+        pytest.param(
+            PromptixError, ("Test error", {"key": "value"}),
+            ["Test error. Details: {'key': 'value'}"],
+            {"key": "value"},
+            id="promptix_error_base",
+        ),
+        pytest.param(
+            PromptNotFoundError, ("TestPrompt", ["Prompt1", "Prompt2"]),
+            ["TestPrompt"],
+            {"prompt_name": "TestPrompt", "available_prompts": ["Prompt1", "Prompt2"]},
+            id="prompt_not_found",
+        ),
+        pytest.param(
+            VersionNotFoundError, ("v2", "TestPrompt", ["v1", "v3"]),
+            ["v2", "TestPrompt"],
+            {"version": "v2", "prompt_name": "TestPrompt"},
+            id="version_not_found",
+        ),
+        pytest.param(
+            VariableValidationError, ("TestPrompt", "test_var", "must be string", 123, "string"),
+            ["test_var", "TestPrompt"],
+            {"variable_name": "test_var", "provided_value": 123},
+            id="variable_validation",
+        ),
+        pytest.param(
+            RequiredVariableError, ("TestPrompt", ["var1", "var2"], ["var3"]),
+            ["var1", "var2"],
+            {"missing_variables": ["var1", "var2"]},
+            id="required_variable",
+        ),
+    ])
+    def test_exception_shape(self, exc_cls, args, expected_substrings, expected_details):
+        """Test that each exception renders its context and exposes it in details."""
+        error = exc_cls(*args)
+        _assert_contains(error, *expected_substrings)
+        for key, value in expected_details.items():
+            assert error.details[key] == value
 
 
 class TestPromptLoader:
@@ -77,24 +105,31 @@ class TestPromptLoader:
 
     def test_prompt_loader_initialization(self):
         """Test PromptLoader initialization."""
-        logger = Mock()
+        logger = SimpleNamespace()
         loader = PromptLoader(logger)
         assert loader._logger == logger
         assert not loader.is_loaded()
 
-    @patch('promptix.core.components.prompt_loader.config')
-    def test_load_prompts_success(self, mock_config, tmp_path, test_prompts_dir):
+    @staticmethod
+    def _use_workspace(monkeypatch, workspace_path):
+        """Point the loader module's config at the given workspace."""
+        from promptix.core.components import prompt_loader
+
+        fake_config = SimpleNamespace(
+            get_prompts_workspace_path=lambda: workspace_path,
+            has_prompts_workspace=lambda: True,
+            create_default_workspace=lambda: workspace_path,
+        )
+        monkeypatch.setattr(prompt_loader, "config", fake_config)
+
+    def test_load_prompts_success(self, monkeypatch, tmp_path, test_prompts_dir):
         """Test successful prompt loading with real fixture directory."""
         import shutil
         
         # Create a temporary workspace with real test prompts
         workspace_path = tmp_path / "prompts"
         shutil.copytree(test_prompts_dir, workspace_path)
-        
-        # Setup mocks to use our temp workspace
-        mock_config.get_prompts_workspace_path.return_value = workspace_path
-        mock_config.has_prompts_workspace.return_value = True
-        mock_config.create_default_workspace.return_value = workspace_path
+        self._use_workspace(monkeypatch, workspace_path)
         
         # Test - loader should load from the real fixtures
         loader = PromptLoader()
@@ -117,121 +152,106 @@ class TestPromptLoader:
             # Check that it has parsed YAML/markdown content
             assert isinstance(simple_chat["versions"], dict)
 
-    @patch('promptix.core.components.prompt_loader.config')
-    def test_load_prompts_uses_workspace(self, mock_config):
-        """Test that the PromptLoader loads from workspace and returns a dict."""
-        # PromptLoader uses workspace-based loading
-        mock_config.get_prompts_workspace_path.return_value = Path("/test/prompts")
-        mock_config.has_prompts_workspace.return_value = True
-        mock_config.create_default_workspace.return_value = Path("/test/prompts")
-        
+    def test_load_prompts_returns_loaded_state(self):
+        """Test that an already-loaded PromptLoader skips the workspace scan."""
         loader = PromptLoader()
-        prompts = loader.load_prompts()  # Should succeed
-        
-        # Should return a dict and be loaded
-        assert isinstance(prompts, dict)
+        loader._prompts = {}
+        loader._loaded = True
+
+        # test_load_prompts_success covers the real workspace scan
+        prompts = loader.load_prompts()
+
+        assert prompts is loader._prompts
         assert loader.is_loaded()
 
-    def test_get_prompt_data_not_found(self):
+    def test_get_prompt_data_not_found(self, loaded_prompt_loader):
         """Test getting prompt data for non-existent prompt."""
-        loader = PromptLoader()
-        loader._prompts = {"ExistingPrompt": {}}
-        loader._loaded = True
-        
-        with pytest.raises(Exception) as exc_info:
-            loader.get_prompt_data("NonExistentPrompt")
-        
-        assert "not found" in str(exc_info.value)
+        with pytest.raises(Exception, match="not found"):
+            loaded_prompt_loader.get_prompt_data("NonExistentPrompt")
+
+
+@pytest.fixture
+def validator():
+    """Fresh VariableValidator for each test."""
+    return VariableValidator()
 
 
 class TestVariableValidator:
     """Test the VariableValidator component."""
 
-    def test_validate_variables_success(self):
-        """Test successful variable validation."""
-        validator = VariableValidator()
-        schema = {
-            "required": ["name", "age"],
-            "types": {"name": "string", "age": "integer"}
-        }
-        user_vars = {"name": "John", "age": 25}
-        
-        # Should not raise any exception
-        validator.validate_variables(schema, user_vars, "TestPrompt")
-
-    def test_validate_variables_missing_required(self):
-        """Test validation with missing required variables."""
-        validator = VariableValidator()
-        schema = {"required": ["name", "age"]}
-        user_vars = {"name": "John"}
-        
-        with pytest.raises(RequiredVariableError) as exc_info:
-            validator.validate_variables(schema, user_vars, "TestPrompt")
-        
-        assert "age" in str(exc_info.value)
-
-    def test_validate_variables_type_mismatch(self):
-        """Test validation with type mismatch."""
-        validator = VariableValidator()
-        schema = {
-            "required": ["name"],
-            "types": {"name": "string"}
-        }
-        user_vars = {"name": 123}
-        
-        with pytest.raises(VariableValidationError) as exc_info:
+    @pytest.mark.parametrize("schema,user_vars,exc,needle", [
+        pytest.param(
+            {"required": ["name", "age"], "types": {"name": "string", "age": "integer"}},
+            {"name": "John", "age": 25},
+            None, None,
+            id="success",
+        ),
+        pytest.param(
+            {"required": ["name", "age"]},
+            {"name": "John"},
+            RequiredVariableError, "age",
+            id="missing_required",
+        ),
+        pytest.param(
+            {"required": ["name"], "types": {"name": "string"}},
+            {"name": 123},
+            VariableValidationError, "must be of type string",
+            id="type_mismatch",
+        ),
+        pytest.param(
+            {"required": ["status"], "types": {"status": ["active", "inactive", "pending"]}},
+            {"status": "unknown"},
+            VariableValidationError, "must be one of",
+            id="enum_violation",
+        ),
+    ])
+    def test_validate_variables(self, validator, schema, user_vars, exc, needle):
+        """Test variable validation outcomes against a schema."""
+        if exc is None:
+            # Should not raise any exception
             validator.validate_variables(schema, user_vars, "TestPrompt")
-        
-        assert "must be of type string" in str(exc_info.value)
-
-    def test_validate_variables_enum_violation(self):
-        """Test validation with enum constraint violation."""
-        validator = VariableValidator()
-        schema = {
-            "required": ["status"],
-            "types": {"status": ["active", "inactive", "pending"]}
-        }
-        user_vars = {"status": "unknown"}
-        
-        with pytest.raises(VariableValidationError) as exc_info:
+            return
+
+        with pytest.raises(exc, match=re.escape(needle)):
             validator.validate_variables(schema, user_vars, "TestPrompt")
-        
-        assert "must be one of" in str(exc_info.value)
+
+
+@pytest.fixture(scope="module")
+def renderer():
+    """TemplateRenderer shared across the module; its Jinja2 environment is stateless per render."""
+    return TemplateRenderer()
 
 
 class TestTemplateRenderer:
     """Test the TemplateRenderer component."""
 
-    def test_render_template_success(self):
+    def test_render_template_success(self, renderer):
         """Test successful template rendering."""
-        renderer = TemplateRenderer()
         template = "Hello {{ name }}!"
         variables = {"name": "World"}
         
         result = renderer.render_template(template, variables, "TestPrompt")
         assert result == "Hello World!"
 
-    def test_render_template_with_newlines(self):
+    def test_render_template_with_newlines(self, renderer):
         """Test template rendering with escaped newlines."""
-        renderer = TemplateRenderer()
         template = "Line 1\\nLine 2"
         
         result = renderer.render_template(template, {}, "TestPrompt")
         assert result == "Line 1\nLine 2"
 
-    def test_render_template_error(self):
+    def test_render_template_error(self, renderer):
         """Test template rendering error handling."""
-        renderer = TemplateRenderer()
         template = "Hello {{ undefined_variable.missing_attr }}!"
         
-        with pytest.raises(TemplateRenderError) as exc_info:
+        with pytest.raises(TemplateRenderError, match="TestPrompt"):
             renderer.render_template(template, {}, "TestPrompt")
-        
-        assert "TestPrompt" in str(exc_info.value)
 
-    def test_render_tools_template_success(self):
+        # The shared renderer must stay usable after a failed render
+        assert renderer.render_template("Hi {{ name }}", {"name": "again"}, "TestPrompt") == "Hi again"
+
+    def test_render_tools_template_success(self, renderer):
         """Test successful tools template rendering."""
-        renderer = TemplateRenderer()
         tools_template = '["tool1", "tool2"]'
         
         result = renderer.render_tools_template(
@@ -239,96 +259,76 @@ class TestTemplateRenderer:
         )
         assert result == ["tool1", "tool2"]
 
-    def test_validate_template(self):
+    def test_validate_template(self, renderer):
         """Test template validation."""
-        renderer = TemplateRenderer()
-        
         assert renderer.validate_template("Hello {{ name }}!")
         assert not renderer.validate_template("Hello {{ unclosed")
 
 
-class TestVersionManager:
-    """Test the VersionManager component."""
+@pytest.fixture(scope="module")
+def version_manager():
+    """VersionManager shared across the module; it holds no per-prompt state."""
+    return VersionManager()
 
-    def test_find_live_version_success(self):
-        """Test finding live version successfully."""
-        manager = VersionManager()
-        versions = {
-            "v1": {"is_live": False},
-            "v2": {"is_live": True},
-            "v3": {"is_live": False}
-        }
-        
-        live_version = manager.find_live_version(versions, "TestPrompt")
-        assert live_version == "v2"
-
-    def test_find_live_version_none(self):
-        """Test error when no live version found."""
-        manager = VersionManager()
-        versions = {
-            "v1": {"is_live": False},
-            "v2": {"is_live": False}
-        }
-        
-        with pytest.raises(NoLiveVersionError) as exc_info:
-            manager.find_live_version(versions, "TestPrompt")
-        
-        assert "TestPrompt" in str(exc_info.value)
-
-    def test_find_live_version_multiple(self):
-        """Test error when multiple live versions found."""
-        manager = VersionManager()
-        versions = {
-            "v1": {"is_live": True},
-            "v2": {"is_live": True}
-        }
-        
-        with pytest.raises(MultipleLiveVersionsError) as exc_info:
-            manager.find_live_version(versions, "TestPrompt")
-        
-        assert "v1" in str(exc_info.value)
-        assert "v2" in str(exc_info.value)
-
-    def test_get_version_data_specific(self):
-        """Test getting specific version data."""
-        manager = VersionManager()
-        versions = {
-            "v1": {"config": {"model": "gpt-3.5-turbo"}},
-            "v2": {"config": {"model": "gpt-4"}}
-        }
-        
-        version_data = manager.get_version_data(versions, "v2", "TestPrompt")
-        assert version_data["config"]["model"] == "gpt-4"
 
-    def test_get_version_data_not_found(self):
-        """Test error when specific version not found."""
-        manager = VersionManager()
-        versions = {"v1": {}}
-        
-        with pytest.raises(VersionNotFoundError) as exc_info:
-            manager.get_version_data(versions, "v3", "TestPrompt")
-        
-        assert "v3" in str(exc_info.value)
-
-    def test_get_system_instruction_success(self):
-        """Test getting system instruction from version data."""
-        manager = VersionManager()
-        version_data = {
-            "config": {"system_instruction": "You are a helpful assistant."}
-        }
-        
-        instruction = manager.get_system_instruction(version_data, "TestPrompt")
-        assert instruction == "You are a helpful assistant."
+class TestVersionManager:
+    """Test the VersionManager component."""
 
-    def test_get_system_instruction_missing(self):
-        """Test error when system instruction is missing."""
-        manager = VersionManager()
-        version_data = {"config": {}}
-        
-        with pytest.raises(ValueError) as exc_info:
-            manager.get_system_instruction(version_data, "TestPrompt")
-        
-        assert "system_instruction" in str(exc_info.value)
+    @pytest.mark.parametrize("method,args,exc,expected", [
+        pytest.param(
+            "find_live_version",
+            (_VERSIONS_ONE_LIVE,),
+            None, "v2",
+            id="find_live_success",
+        ),
+        pytest.param(
+            "find_live_version",
+            (_VERSIONS_NONE_LIVE,),
+            NoLiveVersionError, ["TestPrompt"],
+            id="find_live_none",
+        ),
+        pytest.param(
+            "find_live_version",
+            (_VERSIONS_TWO_LIVE,),
+            MultipleLiveVersionsError, ["v1", "v2"],
+            id="find_live_multiple",
+        ),
+        pytest.param(
+            "get_version_data",
+            (_VERSIONS_BY_MODEL, "v2"),
+            None, {"config": {"model": "gpt-4"}},
+            id="version_data_specific",
+        ),
+        pytest.param(
+            "get_version_data",
+            ({"v1": {}}, "v3"),
+            VersionNotFoundError, ["v3"],
+            id="version_data_not_found",
+        ),
+        pytest.param(
+            "get_system_instruction",
+            ({"config": {"system_instruction": "You are a helpful assistant."}},),
+            None, "You are a helpful assistant.",
+            id="system_instruction_success",
+        ),
+        pytest.param(
+            "get_system_instruction",
+            (_NO_MODEL_VERSION,),
+            ValueError, ["system_instruction"],
+            id="system_instruction_missing",
+        ),
+    ])
+    def test_version_lookup(self, version_manager, method, args, exc, expected):
+        """Test version lookups return the expected data or raise with context."""
+        lookup = getattr(version_manager, method)
+        if exc is None:
+            assert lookup(*args, "TestPrompt") == expected
+            return
+
+        with pytest.raises(exc) as exc_info:
+            lookup(*args, "TestPrompt")
+
+        _assert_contains(exc_info.value, *expected)
 
 
 class TestModelConfigBuilder:
@@ -357,29 +357,23 @@ class TestModelConfigBuilder:
         builder = ModelConfigBuilder()
         memory = [{"role": "user"}]  # Missing content
         
-        with pytest.raises(InvalidMemoryFormatError) as exc_info:
+        with pytest.raises(InvalidMemoryFormatError, match="content"):
             builder.validate_memory_format(memory)
-        
-        assert "content" in str(exc_info.value)
 
     def test_validate_memory_format_invalid_role(self):
         """Test memory validation with invalid role."""
         builder = ModelConfigBuilder()
         memory = [{"role": "invalid", "content": "test"}]
         
-        with pytest.raises(InvalidMemoryFormatError) as exc_info:
+        with pytest.raises(InvalidMemoryFormatError, match="role"):
             builder.validate_memory_format(memory)
-        
-        assert "role" in str(exc_info.value)
 
     def test_build_model_config_success(self):
         """Test successful model config building."""
         builder = ModelConfigBuilder()
         system_message = "You are helpful."
         memory = [{"role": "user", "content": "Hello"}]
-        version_data = {"config": {"model": "gpt-3.5-turbo"}}
-        
-        config = builder.build_model_config(system_message, memory, version_data, "TestPrompt")
+        config = builder.build_model_config(system_message, memory, _OPENAI_VERSION, "TestPrompt")
         
         assert config["model"] == "gpt-3.5-turbo"
         assert config["messages"][0]["role"] == "system"
@@ -389,21 +383,15 @@ class TestModelConfigBuilder:
     def test_build_model_config_missing_model(self):
         """Test error when model is missing from config."""
         builder = ModelConfigBuilder()
-        version_data = {"config": {}}
-        
-        with pytest.raises(ConfigurationError) as exc_info:
-            builder.build_model_config("test", [], version_data, "TestPrompt")
-        
-        assert "Model must be specified" in str(exc_info.value)
+        with pytest.raises(ConfigurationError, match="Model must be specified"):
+            builder.build_model_config("test", [], _NO_MODEL_VERSION, "TestPrompt")
 
     def test_prepare_anthropic_config(self):
         """Test Anthropic-specific config preparation."""
         builder = ModelConfigBuilder()
         system_message = "You are helpful."
         memory = [{"role": "user", "content": "Hello"}]
-        version_data = {"config": {"model": "claude-3-sonnet-20240229"}}
-        
-        config = builder.prepare_anthropic_config(system_message, memory, version_data, "TestPrompt")
+        config = builder.prepare_anthropic_config(system_message, memory, _ANTHROPIC_VERSION, "TestPrompt")
         
         assert config["model"] == "claude-3-sonnet-20240229"
         assert config["system"] == "You are helpful."
@@ -428,7 +416,7 @@ class TestContainer:
     def test_container_register_singleton(self):
         """Test registering and retrieving singleton services."""
         container = Container()
-        test_service = Mock()
+        test_service = SimpleNamespace()
         
         container.register_singleton("test_service", test_service)
         retrieved = container.get("test_service")
@@ -440,7 +428,7 @@ class TestContainer:
         container = Container()
         
         def create_service():
-            return Mock(name="factory_service")
+            return SimpleNamespace(name="factory_service")
         
         container.register_factory("factory_service", create_service)
         service1 = container.get("factory_service")
@@ -453,16 +441,14 @@ class TestContainer:
         """Test error when dependency is missing."""
         container = Container()
         
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="nonexistent_service"):
             container.get("nonexistent_service")
-        
-        assert "nonexistent_service" in str(exc_info.value)
 
     def test_container_scope(self):
         """Test container scoping functionality."""
         container = Container()
-        original_service = Mock(name="original")
-        override_service = Mock(name="override")
+        original_service = SimpleNamespace(name="original")
+        override_service = SimpleNamespace(name="override")
         
         container.register_singleton("test_service", original_service)
         
@@ -470,61 +456,61 @@ class TestContainer:
         scope = container.create_scope()
         scope.override("test_service", override_service)
         
-        # Original container should return original service
-        assert container.get("test_service") is original_service
-        
-        # Scope should return override
-        assert scope.get("test_service") is override_service
+        # Original container keeps its service while the scope returns the override
+        from_container = container.get("test_service")
+        from_scope = scope.get("test_service")
+        assert from_container is original_service and from_scope is override_service
 
 
+@pytest.mark.xdist_group(name="workspace")
 class TestRefactoredIntegration:
     """Integration tests for the refactored architecture."""
 
-    def setup_method(self):
-        """Setup for each test method."""
+    @pytest.fixture
+    def fresh_container(self):
+        """Reset the global container used by the Promptix classmethods."""
         reset_container()
 
-    def test_promptix_integration(self):
+    def test_promptix_integration(self, fresh_container, workspace_available):
         """Test integration of current Promptix class with real workspace."""
-        # This test uses the actual workspace with real prompts
-        # Test with an existing prompt (SimpleChat should exist)
-        try:
-            result = Promptix.get_prompt("SimpleChat", user_name="TestUser", assistant_name="TestBot")
-            # Should return a string (the rendered prompt)
-            assert isinstance(result, str)
-            assert "TestUser" in result
-            assert "TestBot" in result
-        except (FileNotFoundError, KeyError, LookupError):
-            # If no workspace prompts available, just test that the class exists and is callable
-            assert callable(getattr(Promptix, 'get_prompt', None))
-
-    def test_builder_integration(self):
+        if not workspace_available:
+            pytest.skip("no SimpleChat prompt in the workspace")
+
+        result = Promptix.get_prompt("SimpleChat", user_name="TestUser", assistant_name="TestBot")
+        # Should return a string (the rendered prompt)
+        assert isinstance(result, str)
+        assert "TestUser" in result
+        assert "TestBot" in result
+
+    def test_builder_integration(self, fresh_container, workspace_available):
         """Test integration of current PromptixBuilder class with real workspace."""
-        # Test with an existing prompt (SimpleChat should exist)
-        try:
-            builder = Promptix.builder("SimpleChat")
-            # Test that builder exists and is functional
-            assert hasattr(builder, 'build')
-            assert hasattr(builder, 'with_user_name')
-            
-            # Try to build a basic config
-            config = (builder
-                      .with_user_name("TestUser")
-                      .with_assistant_name("TestBot")
-                      .build())
-            
-            # Should return a dictionary with expected structure
-            assert isinstance(config, dict)
-            assert "messages" in config or "prompt" in config
-        except (FileNotFoundError, LookupError):
-            # If no workspace prompts available, just test that the builder method exists
-            assert callable(getattr(Promptix, 'builder', None))
+        if not workspace_available:
+            pytest.skip("no SimpleChat prompt in the workspace")
+
+        builder = Promptix.builder("SimpleChat")
+        # Test that builder exists and is functional
+        assert hasattr(builder, 'build')
+        assert hasattr(builder, 'with_user_name')
+
+        # Try to build a basic config
+        config = (builder
+                  .with_user_name("TestUser")
+                  .with_assistant_name("TestBot")
+                  .build())
+
+        # Should return a dictionary with expected structure
+        assert isinstance(config, dict)
+        assert "messages" in config or "prompt" in config
 
     def test_custom_container_usage(self):
         """Test using custom container for dependency injection."""
         # Create custom container with mock logger
         custom_container = Container()
-        mock_logger = Mock()
+        mock_logger = SimpleNamespace(
+            info=lambda *args, **kwargs: None,
+            warning=lambda *args, **kwargs: None,
+            error=lambda *args, **kwargs: None,
+        )
         custom_container.override("logger", mock_logger)
         
         # Create Promptix instance with custom container
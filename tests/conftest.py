@@ -6,16 +6,25 @@ including mock clients, test data, and helper functions for consistent testing.
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch
-import tempfile
 import os
 import sys
+import json
 import stat
 import yaml
 import shutil
-from typing import Dict, List, Any, Optional
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from collections import ChainMap
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, List, Any
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
 
 # Path to test prompts fixtures
 TEST_PROMPTS_DIR = Path(__file__).parent / "fixtures" / "test_prompts"
@@ -57,8 +66,24 @@ def safe_rmtree(path):
             # Last resort: just pass and let the OS clean up temp files
             pass
 
-# Edge case test data
-EDGE_CASE_DATA = {
+def _freeze(data):
+    """Recursively wrap dicts in read-only mapping proxies."""
+    if isinstance(data, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in data.items()})
+    return data
+
+
+def _thaw(data):
+    """Recursively turn mapping proxies back into plain, mutable dicts."""
+    if isinstance(data, (dict, MappingProxyType)):
+        return {key: _thaw(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_thaw(item) for item in data]
+    return data
+
+
+# Edge case test data (read-only; use mutable_edge_case_data to modify a copy)
+EDGE_CASE_DATA = _freeze({
     "EmptyTemplate": {
         "versions": {
             "v1": {
@@ -120,7 +145,7 @@ EDGE_CASE_DATA = {
             }
         }
     }
-}
+})
 
 
 @pytest.fixture
@@ -128,88 +153,114 @@ def test_prompts_dir():
     """Fixture providing path to test prompts directory."""
     return TEST_PROMPTS_DIR
 
-def _load_prompts_from_directory(prompts_dir: Path) -> Dict[str, Any]:
+def _load_prompts_from_directory(prompts_dir: Path) -> Mapping[str, Any]:
     """Helper function to load prompts from a directory structure.
     
     This shared implementation is used by both sample_prompts_data fixture
-    and MockPromptLoader to ensure consistency.
+    and MockPromptLoader to ensure consistency. Results are cached per
+    directory for the session and read-only; _thaw them for a mutable copy.
     """
-    prompts_data = {}
+    return _load_prompts_cached(str(prompts_dir))
+
+
+# Below this many prompt folders, thread start-up costs more than it saves.
+_PARALLEL_LOAD_MIN_DIRS = 4
+
+
+def _load_prompt_folder(prompt_entry: os.DirEntry):
+    """Load one prompt folder; returns (name, data), or None if it has no config.yaml."""
+    prompt_name = prompt_entry.name
+
+    # libyaml parses bytes directly; a missing config skips the folder
+    try:
+        with open(os.path.join(prompt_entry.path, "config.yaml"), 'rb') as f:
+            config = yaml.load(f, Loader=_SafeLoader)
+    except FileNotFoundError:
+        return None
+    model_config = config.get("config", {})
     
-    for prompt_dir in prompts_dir.iterdir():
-        if not prompt_dir.is_dir():
-            continue
-        prompt_name = prompt_dir.name
-
-        config_file = prompt_dir / "config.yaml"
-        if not config_file.exists():
-            continue
-            
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
-            
-        # Read current template
-        current_file = prompt_dir / "current.md"
-        current_template = ""
-        if current_file.exists():
-            with open(current_file, 'r') as f:
-                current_template = f.read()
-        
-        # Read versioned templates
-        versions = {}
-        versions_dir = prompt_dir / "versions"
-        if versions_dir.exists():
-            for version_file in versions_dir.glob("*.md"):
-                version_name = version_file.stem
-                with open(version_file, 'r') as f:
-                    template = f.read()
-                
-                versions[version_name] = {
-                    "is_live": version_name == "v1",  # Assume v1 is live for testing
-                    "config": {
-                        "system_instruction": template,
-                        "model": config.get("config", {}).get("model", "gpt-3.5-turbo"),
-                        "temperature": config.get("config", {}).get("temperature", 0.7)
-                    },
-                    "schema": config.get("schema", {})
-                }
-        
-        # Add current as live version if no versions found
-        if not versions:
-            versions["v1"] = {
-                "is_live": True,
-                "config": {
-                    "system_instruction": current_template,
-                    "model": config.get("config", {}).get("model", "gpt-3.5-turbo"),
-                    "temperature": config.get("config", {}).get("temperature", 0.7)
-                },
-                "schema": config.get("schema", {})
-            }
+    # Read versioned templates
+    versions = {}
+    try:
+        with os.scandir(os.path.join(prompt_entry.path, "versions")) as version_entries:
+            version_files = [entry for entry in version_entries if entry.name.endswith(".md")]
+    except FileNotFoundError:
+        version_files = []
+
+    for version_entry in version_files:
+        version_name = version_entry.name[:-3]
+        with open(version_entry.path, 'r') as f:
+            template = f.read()
         
-        prompts_data[prompt_name] = {"versions": versions}
+        versions[version_name] = {
+            "is_live": version_name == "v1",  # Assume v1 is live for testing
+            "config": {
+                "system_instruction": template,
+                "model": model_config.get("model", "gpt-3.5-turbo"),
+                "temperature": model_config.get("temperature", 0.7)
+            },
+            "schema": config.get("schema", {})
+        }
+    
+    # Add current as live version if no versions found
+    if not versions:
+        try:
+            with open(os.path.join(prompt_entry.path, "current.md"), 'r') as f:
+                current_template = f.read()
+        except FileNotFoundError:
+            current_template = ""
+
+        versions["v1"] = {
+            "is_live": True,
+            "config": {
+                "system_instruction": current_template,
+                "model": model_config.get("model", "gpt-3.5-turbo"),
+                "temperature": model_config.get("temperature", 0.7)
+            },
+            "schema": config.get("schema", {})
+        }
     
-    return prompts_data
+    return prompt_name, {"versions": versions}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_prompts_cached(prompts_dir_str: str) -> Mapping[str, Any]:
+    with os.scandir(prompts_dir_str) as prompt_entries:
+        prompt_dirs = [entry for entry in prompt_entries if entry.is_dir()]
+
+    if len(prompt_dirs) < _PARALLEL_LOAD_MIN_DIRS:
+        loaded = map(_load_prompt_folder, prompt_dirs)
+    else:
+        # File reads and libyaml parsing release the GIL, so folders load concurrently
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            loaded = list(executor.map(_load_prompt_folder, prompt_dirs))
+
+    return _freeze(dict(item for item in loaded if item is not None))
 
 
 @pytest.fixture
-def sample_prompts_data(test_prompts_dir):
-    """Fixture providing sample prompt data for testing (legacy compatibility)."""
+def sample_prompts_data():
+    """Fixture providing sample prompt data for testing (legacy compatibility).
+
+    Parsed once per session; each test gets its own mutable copy.
+    """
     # Use the shared helper function
-    return _load_prompts_from_directory(test_prompts_dir)
+    return _thaw(_load_prompts_from_directory(TEST_PROMPTS_DIR))
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def edge_case_data():
-    """Fixture providing edge case prompt data for testing."""
-    import copy
-    return copy.deepcopy(EDGE_CASE_DATA)
+    """Fixture providing read-only edge case prompt data for testing."""
+    return EDGE_CASE_DATA
 
 @pytest.fixture
-def all_test_data(sample_prompts_data, edge_case_data):
-    """Fixture combining all test data."""
-    import copy
-    combined = copy.deepcopy(sample_prompts_data)
-    combined.update(copy.deepcopy(edge_case_data))
-    return combined
+def mutable_edge_case_data():
+    """Fixture providing a private, mutable copy of the edge case prompt data."""
+    return _thaw(EDGE_CASE_DATA)
+
+@pytest.fixture(scope="session")
+def all_test_data(edge_case_data):
+    """Fixture combining all read-only test data; edge cases take precedence on name clashes."""
+    return ChainMap(edge_case_data, _load_prompts_from_directory(TEST_PROMPTS_DIR))
 
 @pytest.fixture
 def temp_prompts_dir_compat(test_prompts_dir):
@@ -231,166 +282,221 @@ def temp_prompts_file(test_prompts_dir):
     yield str(test_prompts_dir)
 
 @pytest.fixture
-def temp_prompts_dir(test_prompts_dir):
+def temp_prompts_dir(test_prompts_dir, tmp_path):
     """Create a temporary copy of the test prompts directory structure."""
-    temp_dir = tempfile.mkdtemp()
-    prompts_dir = Path(temp_dir) / "prompts"
+    prompts_dir = tmp_path / "prompts"
     
-    # Copy test fixtures to temp directory
+    # Copy test fixtures to temp directory; pytest cleans up tmp_path
     shutil.copytree(test_prompts_dir, prompts_dir)
     
-    yield prompts_dir
-    
-    # Cleanup - use safe_rmtree for Windows compatibility
-    safe_rmtree(temp_dir)
+    return prompts_dir
+
+
+# Canned API responses, built once and shared read-only by the fake clients
+_OPENAI_RESPONSE = SimpleNamespace(
+    choices=[SimpleNamespace(message=SimpleNamespace(content="This is a mock response from OpenAI"))],
+    usage=SimpleNamespace(prompt_tokens=10, completion_tokens=15, total_tokens=25),
+)
+_ANTHROPIC_RESPONSE = SimpleNamespace(
+    content=[SimpleNamespace(text="This is a mock response from Anthropic")],
+    usage=SimpleNamespace(input_tokens=12, output_tokens=18),
+)
+
+
+class _FakeCreateEndpoint:
+    """Stand-in for a client's ``create`` endpoint that records the kwargs of each call."""
+
+    __slots__ = ("calls", "_response")
+
+    def __init__(self, response):
+        self.calls: List[Dict[str, Any]] = []
+        self._response = response
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self._response
 
 
 @pytest.fixture
 def mock_openai_client():
-    """Create a comprehensive mock OpenAI client for testing."""
-    mock_client = MagicMock()
-    mock_response = MagicMock()
-    mock_choice = MagicMock()
-    mock_message = MagicMock()
-    
-    # Configure the response chain
-    mock_message.content = "This is a mock response from OpenAI"
-    mock_choice.message = mock_message
-    mock_response.choices = [mock_choice]
-    
-    # Configure usage statistics
-    mock_usage = MagicMock()
-    mock_usage.prompt_tokens = 10
-    mock_usage.completion_tokens = 15
-    mock_usage.total_tokens = 25
-    mock_response.usage = mock_usage
-    
-    mock_client.chat.completions.create.return_value = mock_response
-    
-    return mock_client
+    """Create a fake OpenAI client; ``chat.completions.calls`` records each create() call."""
+    return SimpleNamespace(chat=SimpleNamespace(completions=_FakeCreateEndpoint(_OPENAI_RESPONSE)))
 
 
 @pytest.fixture
 def mock_anthropic_client():
-    """Create a comprehensive mock Anthropic client for testing."""
-    mock_client = MagicMock()
-    mock_response = MagicMock()
-    mock_content = MagicMock()
-    
-    # Configure the response
-    mock_content.text = "This is a mock response from Anthropic"
-    mock_response.content = [mock_content]
-    
-    # Configure usage statistics
-    mock_usage = MagicMock()
-    mock_usage.input_tokens = 12
-    mock_usage.output_tokens = 18
-    mock_response.usage = mock_usage
-    
-    mock_client.messages.create.return_value = mock_response
-    
-    return mock_client
+    """Create a fake Anthropic client; ``messages.calls`` records each create() call."""
+    return SimpleNamespace(messages=_FakeCreateEndpoint(_ANTHROPIC_RESPONSE))
 
 
-@pytest.fixture
-def mock_config(test_prompts_dir):
+class _MockConfig:
+    """Static stand-in for the Promptix config, pointing at the test prompts."""
+
+    __slots__ = ("_prompts_dir",)
+
+    def __init__(self, prompts_dir: Path):
+        self._prompts_dir = str(prompts_dir)
+
+    def get_prompts_dir(self) -> str:
+        return self._prompts_dir
+
+    def get_prompt_file_path(self) -> str:
+        return self._prompts_dir  # Backward compatibility
+
+    def check_for_unsupported_files(self) -> List[Path]:
+        return []
+
+
+@pytest.fixture(scope="session")
+def mock_config():
     """Mock configuration object for testing."""
-    mock = MagicMock()
-    mock.get_prompts_dir.return_value = str(test_prompts_dir)
-    mock.get_prompt_file_path.return_value = str(test_prompts_dir)  # Backward compatibility
-    mock.check_for_unsupported_files.return_value = []
-    return mock
+    return _MockConfig(TEST_PROMPTS_DIR)
+
+
+_SAMPLE_MEMORY = (
+    {"role": "user", "content": "Hello, can you help me?"},
+    {"role": "assistant", "content": "Of course! I'm here to help."},
+    {"role": "user", "content": "What's the weather like?"}
+)
+
+_INVALID_MEMORY = (
+    {"role": "user"},  # Missing content
+    {"role": "invalid_role", "content": "test"},  # Invalid role
+    {"content": "missing role"},  # Missing role
+    "not a dict"  # Invalid format
+)
 
 
 @pytest.fixture
 def sample_memory():
-    """Sample conversation memory for testing."""
-    return [
-        {"role": "user", "content": "Hello, can you help me?"},
-        {"role": "assistant", "content": "Of course! I'm here to help."},
-        {"role": "user", "content": "What's the weather like?"}
-    ]
+    """Sample conversation memory for testing.
 
+    Memory validation requires a list, so each test gets a fresh list over
+    the shared message dicts.
+    """
+    return list(_SAMPLE_MEMORY)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def invalid_memory():
-    """Invalid conversation memory for testing error handling."""
-    return [
-        {"role": "user"},  # Missing content
-        {"role": "invalid_role", "content": "test"},  # Invalid role
-        {"content": "missing role"},  # Missing role
-        "not a dict"  # Invalid format
-    ]
+    """Invalid conversation memory for testing error handling (shared tuple)."""
+    return _INVALID_MEMORY
 
 
-@pytest.fixture
-def large_dataset():
-    """Large dataset for performance testing."""
-    return {
-        f"Prompt{i}": {
+_LARGE_DATASET_VARS = tuple(sys.intern(f"var{k}") for k in range(5))
+_LARGE_DATASET_PLACEHOLDERS = " ".join(f"{{{var}}}" for var in _LARGE_DATASET_VARS)
+# Every version shares this schema by reference; the dataset is read-only.
+_LARGE_DATASET_SCHEMA = {
+    "required": list(_LARGE_DATASET_VARS),
+    "types": dict.fromkeys(_LARGE_DATASET_VARS, "string"),
+}
+
+
+class LargePromptDataset(Mapping):
+    """Read-only mapping of synthetic prompts, built on first access and then cached.
+
+    Entries share their schema dict, so callers must not mutate them.
+    """
+
+    def __init__(self, prompt_count: int = 100, version_count: int = 3):
+        self._indexes = {f"Prompt{i}": i for i in range(prompt_count)}
+        self._version_count = version_count
+        self._entries: Dict[str, Any] = {}
+
+    def _build(self, i: int) -> Dict[str, Any]:
+        return {
             "versions": {
                 f"v{j}": {
                     "is_live": j == 1,
                     "config": {
-                        "system_instruction": f"This is prompt {i} version {j} with variables " + " ".join([f"{{var{k}}}" for k in range(5)]),
+                        "system_instruction": f"This is prompt {i} version {j} with variables {_LARGE_DATASET_PLACEHOLDERS}",
                         "model": "gpt-3.5-turbo"
                     },
-                    "schema": {
-                        "required": [f"var{k}" for k in range(5)],
-                        "types": {f"var{k}": "string" for k in range(5)}
-                    }
+                    "schema": _LARGE_DATASET_SCHEMA
                 }
-                for j in range(1, 4)  # 3 versions each
+                for j in range(1, self._version_count + 1)
             }
         }
-        for i in range(100)  # 100 prompts
-    }
 
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = self._build(self._indexes[key])
+        return entry
 
-@pytest.fixture
-def complex_template_variables():
-    """Complex template variables for testing edge cases."""
-    return {
-        "simple_string": "Hello World",
-        "empty_string": "",
-        "unicode_string": "Hello 世界 🌍",
-        "multiline_string": "Line 1\nLine 2\nLine 3",
-        "number": 42,
-        "float_number": 3.14159,
-        "boolean_true": True,
-        "boolean_false": False,
-        "none_value": None,
-        "list_strings": ["apple", "banana", "cherry"],
-        "list_numbers": [1, 2, 3, 4, 5],
-        "empty_list": [],
-        "nested_dict": {
-            "level1": {
-                "level2": {
-                    "value": "deep_value"
-                }
+    def __iter__(self):
+        return iter(self._indexes)
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+
+@pytest.fixture(scope="session")
+def large_dataset():
+    """Large dataset for performance testing (100 prompts x 3 versions, built lazily)."""
+    return LargePromptDataset()
+
+
+# Read-only at the top level; nested values are plain containers shared by all tests
+_COMPLEX_TEMPLATE_VARIABLES = MappingProxyType({
+    "simple_string": "Hello World",
+    "empty_string": "",
+    "unicode_string": "Hello 世界 🌍",
+    "multiline_string": "Line 1\nLine 2\nLine 3",
+    "number": 42,
+    "float_number": 3.14159,
+    "boolean_true": True,
+    "boolean_false": False,
+    "none_value": None,
+    "list_strings": ["apple", "banana", "cherry"],
+    "list_numbers": [1, 2, 3, 4, 5],
+    "empty_list": [],
+    "nested_dict": {
+        "level1": {
+            "level2": {
+                "value": "deep_value"
             }
-        },
-        "mixed_list": ["string", 123, True, {"key": "value"}],
-        "special_chars": "Special: !@#$%^&*()_+-=[]{}|;:,.<>?",
-        "html_content": "<div>HTML content</div>",
-        "json_string": '{"key": "value", "number": 123}'
-    }
+        }
+    },
+    "mixed_list": ["string", 123, True, {"key": "value"}],
+    "special_chars": "Special: !@#$%^&*()_+-=[]{}|;:,.<>?",
+    "html_content": "<div>HTML content</div>",
+    "json_string": '{"key": "value", "number": 123}'
+})
+
+
+@pytest.fixture(scope="session")
+def complex_template_variables():
+    """Complex template variables for testing edge cases (shared, read-only)."""
+    return _COMPLEX_TEMPLATE_VARIABLES
+
+
+@pytest.fixture
+def complex_template_variables_mutable():
+    """Private, mutable copy of the complex template variables."""
+    return _thaw(_COMPLEX_TEMPLATE_VARIABLES)
+
+
+_MISSING = object()
+_NO_PROMPTS = MappingProxyType({})
 
 
 class MockPromptLoader:
     """Mock prompt loader for consistent testing."""
     
+    __slots__ = ("prompts_dir", "prompts_data", "_loaded")
+    
     def __init__(self, prompts_dir=None):
         self.prompts_dir = Path(prompts_dir) if prompts_dir else TEST_PROMPTS_DIR
         self._loaded = False
-        self.prompts_data = {}
+        self.prompts_data = _NO_PROMPTS  # replaced on load_prompts()
     
     def load_prompts(self):
         """Mock loading prompts from folder structure."""
         self._loaded = True
         
-        # Use the shared helper function
-        self.prompts_data = _load_prompts_from_directory(self.prompts_dir)
+        # Use the shared helper function; copy so callers can't change the cached data
+        self.prompts_data = _thaw(_load_prompts_from_directory(self.prompts_dir))
         
         return self.prompts_data
     
@@ -403,10 +509,11 @@ class MockPromptLoader:
         if not self._loaded:
             raise ValueError("Prompts not loaded")
         
-        if prompt_name not in self.prompts_data:
+        data = self.prompts_data.get(prompt_name, _MISSING)
+        if data is _MISSING:
             raise ValueError(f"Prompt '{prompt_name}' not found")
         
-        return self.prompts_data[prompt_name]
+        return data
 
 
 @pytest.fixture
@@ -416,22 +523,37 @@ def mock_prompt_loader(test_prompts_dir):
 
 
 @pytest.fixture
-def mock_prompt_loader_with_edge_cases():
+def mock_prompt_loader_with_edge_cases(edge_case_data):
     """Mock prompt loader with edge case data."""
     # For edge cases, we'll use the hardcoded data since these are
-    # special test cases that don't exist as real prompt folders
+    # special test cases that don't exist as real prompt folders.
+    # The read-only snapshot is shared with edge_case_data.
     loader = MockPromptLoader()
-    loader.prompts_data = EDGE_CASE_DATA
+    loader.prompts_data = edge_case_data
+    loader._loaded = True
+    return loader
+
+
+@pytest.fixture(scope="session")
+def loaded_prompt_loader():
+    """Real PromptLoader pre-populated with a single prompt, shared across the session.
+
+    Only suitable for read-only lookups; tests must not mutate its prompts.
+    """
+    from promptix.core.components.prompt_loader import PromptLoader
+
+    loader = PromptLoader()
+    loader._prompts = {"ExistingPrompt": {}}
     loader._loaded = True
     return loader
 
 
-@pytest.fixture(autouse=True)
-def reset_global_state():
-    """Reset global state before each test to ensure isolation."""
-    # Clear any cached data or global state
-    yield
-    # Cleanup after test if needed
+@pytest.fixture(scope="session")
+def workspace_available():
+    """Whether the working directory has a prompts/ workspace with the SimpleChat agent."""
+    from promptix.core.config import config
+
+    return config.has_prompts_workspace() and (config.get_prompts_workspace_path() / "SimpleChat").is_dir()
 
 
 @pytest.fixture
@@ -445,10 +567,17 @@ def performance_test_config():
 
 
 # Helper functions for tests
-def create_test_prompt_file(data: Dict[str, Any], file_path: str) -> None:
-    """Helper to create test prompt files."""
-    with open(file_path, 'w') as f:
-        yaml.dump(data, f)
+def create_test_prompt_file(data: Dict[str, Any], file_path: str, format: str = "json") -> None:
+    """Helper to create test prompt files.
+
+    JSON is a subset of YAML, so the default JSON output still loads as a
+    .yaml config; pass format="yaml" when a test needs YAML-style formatting.
+    """
+    with open(file_path, 'w', encoding='utf-8') as f:
+        if format == "yaml":
+            yaml.dump(data, f, Dumper=_SafeDumper)
+        else:
+            json.dump(data, f, ensure_ascii=False)
 
 
 def assert_valid_model_config(config: Dict[str, Any]) -> None:
@@ -473,37 +602,6 @@ def assert_valid_memory_format(memory: List[Dict[str, str]]) -> None:
         assert isinstance(message["content"], str)
 
 
-# Parametrized test data
-TEMPLATE_RENDERING_CASES = [
-    ("Simple variable", "Hello {{name}}", {"name": "World"}, "Hello World"),
-    ("Multiple variables", "{{greeting}} {{name}}!", {"greeting": "Hi", "name": "Alice"}, "Hi Alice!"),
-    ("No variables", "Static text", {}, "Static text"),
-    ("Empty template", "", {}, ""),
-    ("Conditional", "{% if show %}Visible{% endif %}", {"show": True}, "Visible"),
-    ("Loop", "{% for item in items %}{{item}} {% endfor %}", {"items": ["a", "b"]}, "a b "),
-    ("Filter", "{{ name | upper }}", {"name": "john"}, "JOHN"),
-    ("Nested", "{{user.name}}", {"user": {"name": "Bob"}}, "Bob"),
-]
-
-ERROR_CASES = [
-    ("Missing variable", "Hello {{missing}}", {}, "UndefinedError"),
-    ("Invalid syntax", "Hello {{unclosed", {}, "TemplateSyntaxError"),
-    ("Type error", "{{number.upper}}", {"number": 42}, "UndefinedError"),
-]
-
-
-@pytest.fixture(params=TEMPLATE_RENDERING_CASES)
-def template_case(request):
-    """Parametrized fixture for template rendering test cases."""
-    return request.param
-
-
-@pytest.fixture(params=ERROR_CASES)
-def error_case(request):
-    """Parametrized fixture for error test cases."""
-    return request.param
-
-
 # Custom assertions for better test readability
 class TestAssertions:
     """Custom assertions for Promptix testing."""
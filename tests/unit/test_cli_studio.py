@@ -0,0 +1,167 @@
+"""
+Unit tests for the background Studio handling in the Promptix CLI.
+
+Covers the PID file, stale PID cleanup and the detached launch without
+starting a real Streamlit process.
+"""
+
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+cli_module = pytest.importorskip("promptix.tools.cli")
+
+
+class _FakeProcess:
+    """Stand-in for subprocess.Popen that records how it was called."""
+
+    pid = 4242
+
+    def __init__(self, args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+@pytest.fixture
+def pid_file(tmp_path, monkeypatch):
+    """Point the CLI at a PID file inside a temporary home."""
+    path = tmp_path / ".promptix" / "studio.pid"
+    monkeypatch.setattr(cli_module, "STUDIO_PID_FILE", path)
+    return path
+
+
+def _write_pid_file(path, pid, port, cwd=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    info = {"pid": pid, "port": port}
+    if cwd is not None:
+        info["cwd"] = cwd
+    path.write_text(json.dumps(info))
+
+
+def _fake_kill(alive_pids):
+    def kill(pid, sig):
+        assert sig == 0
+        if pid not in alive_pids:
+            raise ProcessLookupError(pid)
+    return kill
+
+
+@pytest.mark.skipif(os.name == "nt", reason="PID liveness check uses os.kill on POSIX only")
+class TestGetRunningStudio:
+    """Test reading the background Studio PID file."""
+
+    def test_alive_pid(self, pid_file, monkeypatch):
+        _write_pid_file(pid_file, 1234, 8600, cwd="/work/project")
+        monkeypatch.setattr(cli_module.os, "kill", _fake_kill({1234}))
+        monkeypatch.setattr(cli_module, "is_port_in_use", lambda port: port == 8600)
+
+        assert cli_module.get_running_studio() == {"pid": 1234, "port": 8600, "cwd": "/work/project"}
+        assert pid_file.exists()
+
+    def test_pid_file_without_workspace(self, pid_file, monkeypatch):
+        _write_pid_file(pid_file, 1234, 8600)
+        monkeypatch.setattr(cli_module.os, "kill", _fake_kill({1234}))
+        monkeypatch.setattr(cli_module, "is_port_in_use", lambda port: True)
+
+        assert cli_module.get_running_studio()["cwd"] is None
+
+    def test_stale_pid_removes_file(self, pid_file, monkeypatch):
+        _write_pid_file(pid_file, 1234, 8600)
+        monkeypatch.setattr(cli_module.os, "kill", _fake_kill(set()))
+        monkeypatch.setattr(cli_module, "is_port_in_use", lambda port: True)
+
+        assert cli_module.get_running_studio() is None
+        assert not pid_file.exists()
+
+    def test_missing_file(self, pid_file):
+        assert cli_module.get_running_studio() is None
+
+
+class TestStartStudioDaemon:
+    """Test the detached Studio launch."""
+
+    def test_records_pid_port_and_workspace(self, pid_file, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        launched = []
+
+        def fake_popen(args, **kwargs):
+            launched.append(_FakeProcess(args, **kwargs))
+            return launched[-1]
+
+        monkeypatch.setattr(cli_module.subprocess, "Popen", fake_popen)
+
+        pid = cli_module.start_studio_daemon("/usr/bin/streamlit", "/app.py", 8600)
+
+        assert pid == 4242
+        workspace = str(tmp_path.resolve())
+        assert json.loads(pid_file.read_text()) == {"pid": 4242, "port": 8600, "cwd": workspace}
+        assert launched[0].args == ["/usr/bin/streamlit", "run", "/app.py", "--server.port", "8600"]
+        assert launched[0].kwargs["cwd"] == workspace
+        assert pid_file.with_name("studio.log").exists()
+
+
+class TestStudioCommand:
+    """Test the studio command when a background Studio is already running."""
+
+    @pytest.fixture
+    def running(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        info = {"pid": 1234, "port": 8600, "cwd": str(tmp_path.resolve())}
+        monkeypatch.setattr(cli_module, "get_running_studio", lambda: info)
+        return info
+
+    def test_reports_running_studio(self, running):
+        result = CliRunner().invoke(cli_module.cli, ["studio"])
+
+        assert result.exit_code == 0
+        assert "already running" in result.output
+        assert "Ignoring --port" not in result.output
+
+    def test_warns_on_different_explicit_port(self, running):
+        result = CliRunner().invoke(cli_module.cli, ["studio", "--port", "9000"])
+
+        assert result.exit_code == 0
+        assert "Ignoring --port 9000" in result.output
+
+    def test_same_explicit_port_is_quiet(self, running):
+        result = CliRunner().invoke(cli_module.cli, ["studio", "--port", "8600"])
+
+        assert result.exit_code == 0
+        assert "Ignoring --port" not in result.output
+
+    def test_other_project_starts_separate_studio(self, running, monkeypatch):
+        running["cwd"] = "/work/other-project"
+        started = []
+        monkeypatch.setattr(cli_module.shutil, "which", lambda name: "/usr/bin/streamlit")
+        monkeypatch.setattr(cli_module, "is_port_in_use", lambda port: False)
+        monkeypatch.setattr(
+            cli_module, "start_studio_daemon",
+            lambda streamlit_path, app_path, port: started.append(port) or 4242,
+        )
+
+        result = CliRunner().invoke(cli_module.cli, ["studio", "--daemon", "--port", "8700"])
+
+        assert result.exit_code == 0
+        assert "Starting a separate Studio" in result.output
+        assert "already running" not in result.output
+        assert started == [8700]
+
+    def test_foreground_launch_failure_exits_cleanly(self, tmp_path, monkeypatch):
+        bootstrap = pytest.importorskip("streamlit.web.bootstrap")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(cli_module, "get_running_studio", lambda: None)
+        monkeypatch.setattr(cli_module, "is_port_in_use", lambda port: False)
+        monkeypatch.setattr(bootstrap, "load_config_options", lambda flag_options: None)
+
+        def failing_run(*args, **kwargs):
+            raise RuntimeError("server failed to start")
+
+        monkeypatch.setattr(bootstrap, "run", failing_run)
+
+        result = CliRunner().invoke(cli_module.cli, ["studio"])
+
+        assert result.exit_code == 1
+        assert "Error launching Promptix Studio" in result.output
+        assert "server failed to start" in result.output
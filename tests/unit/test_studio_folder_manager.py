@@ -0,0 +1,305 @@
+"""
+Unit tests for the Studio FolderBasedPromptManager.
+
+Tests loading, saving and querying prompts in the folder-based structure
+used by Promptix Studio.
+"""
+
+import os
+import shutil
+
+import pytest
+import yaml
+from pathlib import Path
+
+from promptix.core.config import config
+from promptix.tools.studio.folder_manager import FolderBasedPromptManager
+
+
+def _write_prompt(prompts_dir: Path, prompt_id: str, last_modified: str, versions=("v1",)):
+    """Write a minimal prompt folder for tests."""
+    prompt_dir = prompts_dir / prompt_id
+    (prompt_dir / "versions").mkdir(parents=True)
+    config_data = {
+        "metadata": {
+            "name": prompt_id.title(),
+            "description": f"{prompt_id} description",
+            "created_at": "2024-01-01T00:00:00",
+            "last_modified": last_modified,
+        },
+        "schema": {"required": [], "optional": [], "properties": {}},
+        "config": {"model": "gpt-4o", "provider": "openai"},
+    }
+    with open(prompt_dir / "config.yaml", "w") as f:
+        yaml.dump(config_data, f, sort_keys=False)
+    for version in versions:
+        (prompt_dir / "versions" / f"{version}.md").write_text(f"Template {version}")
+    (prompt_dir / "current.md").write_text(f"Template {versions[-1]}")
+    return prompt_dir
+
+
+@pytest.fixture
+def studio_workspace(tmp_path, monkeypatch):
+    """Point the global config at a temporary workspace with a few prompts."""
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    _write_prompt(prompts_dir, "alpha", "2024-01-03T00:00:00")
+    _write_prompt(prompts_dir, "beta", "2024-01-01T00:00:00", versions=("v1", "v2"))
+    _write_prompt(prompts_dir, "gamma", "2024-01-02T00:00:00")
+    monkeypatch.setattr(config, "working_directory", tmp_path)
+    return prompts_dir
+
+
+@pytest.fixture
+def manager(studio_workspace):
+    """Create a FolderBasedPromptManager over the temporary workspace."""
+    return FolderBasedPromptManager()
+
+
+class TestLoadPrompts:
+    """Test loading prompts from the folder structure."""
+
+    def test_load_prompts(self, manager):
+        prompts = manager.load_prompts()
+
+        assert prompts["schema"] == 1.0
+        assert set(prompts) == {"schema", "alpha", "beta", "gamma"}
+        assert set(prompts["beta"]["versions"]) == {"v1", "v2"}
+        assert prompts["beta"]["versions"]["v2"]["is_live"] is True
+        assert prompts["beta"]["versions"]["v1"]["is_live"] is False
+        assert prompts["beta"]["versions"]["v2"]["config"]["model"] == "gpt-4o"
+
+    def test_get_missing_prompt(self, manager):
+        assert manager.get_prompt("does_not_exist") is None
+
+
+class TestRecentPrompts:
+    """Test get_recent_prompts ordering and contents."""
+
+    def test_recent_prompts_ordered_by_last_modified(self, manager):
+        recent = manager.get_recent_prompts(limit=2)
+
+        assert [p["id"] for p in recent] == ["alpha", "gamma"]
+        assert recent[0]["name"] == "Alpha"
+        assert recent[0]["description"] == "alpha description"
+
+    def test_recent_prompts_skips_template_reads(self, manager, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("templates should not be loaded")
+
+        monkeypatch.setattr(manager, "_load_single_prompt", fail)
+
+        assert len(manager.get_recent_prompts()) == 3
+
+
+class TestAddVersion:
+    """Test adding versions without rewriting the whole prompt."""
+
+    def test_add_version_writes_only_new_file(self, manager, studio_workspace):
+        v1_file = studio_workspace / "beta" / "versions" / "v1.md"
+        v1_mtime = v1_file.stat().st_mtime_ns
+
+        manager.add_version("beta", "v3", {"config": {"system_instruction": "Template v3"}})
+
+        assert (studio_workspace / "beta" / "versions" / "v3.md").read_text() == "Template v3"
+        assert v1_file.stat().st_mtime_ns == v1_mtime
+        assert (studio_workspace / "beta" / "current.md").read_text() == "Template v2"
+        with open(studio_workspace / "beta" / "config.yaml") as f:
+            config_data = yaml.safe_load(f)
+        assert config_data["metadata"]["last_modified"] > "2024-01-01T00:00:00"
+        assert config_data["config"]["model"] == "gpt-4o"
+
+    def test_add_live_version_updates_current(self, manager, studio_workspace):
+        manager.add_version("beta", "v3", {
+            "is_live": True,
+            "config": {"system_instruction": "Live v3", "model": "gpt-4o-mini"},
+        })
+
+        assert (studio_workspace / "beta" / "current.md").read_text() == "Live v3"
+        prompt = manager.get_prompt("beta")
+        assert prompt["versions"]["v3"]["is_live"] is True
+        assert prompt["versions"]["v3"]["config"]["model"] == "gpt-4o-mini"
+
+    def test_add_version_to_missing_prompt(self, manager):
+        with pytest.raises(ValueError, match="not found"):
+            manager.add_version("does_not_exist", "v1", {})
+
+
+class TestSavePrompt:
+    """Test saving prompts back to the folder structure."""
+
+    def test_save_roundtrip(self, manager, studio_workspace):
+        prompt = manager.get_prompt("beta")
+        prompt["versions"]["v2"]["config"]["system_instruction"] = "Edited v2"
+        manager.save_prompt("beta", prompt)
+
+        reloaded = manager.get_prompt("beta")
+        assert reloaded["versions"]["v2"]["config"]["system_instruction"] == "Edited v2"
+        assert reloaded["versions"]["v2"]["is_live"] is True
+        assert (studio_workspace / "beta" / "current.md").read_text() == "Edited v2"
+
+    def test_save_skips_unchanged_versions(self, manager, studio_workspace):
+        prompt = manager.get_prompt("beta")
+        prompt["versions"]["v2"]["config"]["system_instruction"] = "Edited v2"
+
+        written = []
+        original = manager._write_if_changed
+
+        def tracking_write(path, text):
+            if original(path, text):
+                written.append(path.name)
+
+        manager._write_if_changed = tracking_write
+        manager.save_prompt("beta", prompt)
+
+        assert "v1.md" not in written
+        assert "v2.md" in written
+        assert "current.md" in written
+
+    def test_save_rewrites_externally_modified_file(self, manager, studio_workspace):
+        prompt = manager.get_prompt("beta")
+        v1_file = studio_workspace / "beta" / "versions" / "v1.md"
+        v1_file.write_text("Changed outside Studio!")
+
+        manager.save_prompt("beta", prompt)
+
+        assert v1_file.read_text() == "Template v1"
+
+
+class TestPromptsDirectoryCache:
+    """Test the cached prompts directory existence check."""
+
+    def test_existence_check_is_cached(self, manager, monkeypatch):
+        assert manager._prompts_dir_verified is True
+
+        def fail(*args, **kwargs):
+            raise AssertionError("prompts_dir.exists() should not be called")
+
+        monkeypatch.setattr(type(manager.prompts_dir), "exists", fail)
+        assert manager._prompts_dir_exists() is True
+
+    def test_removed_directory_resets_cache(self, manager, studio_workspace):
+        shutil.rmtree(studio_workspace)
+
+        assert manager.load_prompts() == {"schema": 1.0}
+        assert manager._prompts_dir_verified is False
+        assert manager.get_recent_prompts() == []
+
+
+class TestCreatePrompt:
+    """Test creating new prompts."""
+
+    def test_create_prompt_sanitizes_id(self, manager, studio_workspace):
+        prompt_id = manager.create_new_prompt("My New-Prompt", "desc")
+
+        assert prompt_id == "my_new_prompt"
+        assert (studio_workspace / prompt_id / "config.yaml").exists()
+        assert manager.get_prompt(prompt_id)["description"] == "desc"
+
+    def test_create_prompt_makes_id_unique(self, manager):
+        assert manager.create_new_prompt("Alpha") == "alpha_1"
+        assert manager.create_new_prompt("Alpha") == "alpha_2"
+
+    def test_create_prompt_id_unique_ignoring_case(self, manager, studio_workspace):
+        _write_prompt(studio_workspace, "Delta", "2024-01-04T00:00:00")
+
+        prompt_id = manager.create_new_prompt("delta")
+
+        assert prompt_id == "delta_1"
+        assert (studio_workspace / "Delta" / "current.md").read_text() == "Template v1"
+
+
+class TestJsonSidecar:
+    """Test the optional config.json sidecar (PROMPTIX_STORAGE_FORMAT=json)."""
+
+    def test_sidecar_disabled_by_default(self, manager, studio_workspace):
+        manager.save_prompt("alpha", manager.get_prompt("alpha"))
+
+        assert not (studio_workspace / "alpha" / "config.json").exists()
+
+    def test_sidecar_written_and_preferred(self, manager, studio_workspace, monkeypatch):
+        monkeypatch.setenv("PROMPTIX_STORAGE_FORMAT", "json")
+        manager.save_prompt("alpha", manager.get_prompt("alpha"))
+
+        json_file = studio_workspace / "alpha" / "config.json"
+        assert json_file.exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config.yaml should not be parsed")
+
+        monkeypatch.setattr("promptix.tools.studio.folder_manager.yaml.load", fail)
+        assert manager.get_prompt("alpha")["name"] == "Alpha"
+
+    def test_newer_yaml_wins_over_sidecar(self, manager, studio_workspace, monkeypatch):
+        monkeypatch.setenv("PROMPTIX_STORAGE_FORMAT", "json")
+        manager.save_prompt("alpha", manager.get_prompt("alpha"))
+
+        yaml_file = studio_workspace / "alpha" / "config.yaml"
+        with open(yaml_file) as f:
+            config_data = yaml.safe_load(f)
+        config_data["metadata"]["name"] = "Edited By Hand"
+        with open(yaml_file, "w") as f:
+            yaml.dump(config_data, f)
+        json_file = studio_workspace / "alpha" / "config.json"
+        json_mtime = json_file.stat().st_mtime_ns
+        os.utime(yaml_file, ns=(json_mtime + 1_000_000, json_mtime + 1_000_000))
+
+        assert manager.get_prompt("alpha")["name"] == "Edited By Hand"
+
+
+class TestDeletePrompt:
+    """Test deleting prompts."""
+
+    def test_delete_prompt(self, manager, studio_workspace):
+        assert manager.delete_prompt("beta") is True
+        assert not (studio_workspace / "beta").exists()
+        assert "beta" not in manager.load_prompts()
+
+    def test_delete_prompt_with_nested_folders(self, manager, studio_workspace):
+        nested = studio_workspace / "beta" / "versions" / "archive"
+        nested.mkdir()
+        (nested / "old.md").write_text("old")
+
+        assert manager.delete_prompt("beta") is True
+        assert not (studio_workspace / "beta").exists()
+
+    def test_delete_symlinked_prompt_leaves_target(self, manager, studio_workspace, tmp_path):
+        outside = _write_prompt(tmp_path / "outside", "linked", "2024-01-04T00:00:00")
+        (studio_workspace / "linked").symlink_to(outside, target_is_directory=True)
+
+        assert manager.delete_prompt("linked") is False
+        assert (outside / "config.yaml").exists()
+        assert (outside / "current.md").exists()
+        assert (outside / "versions" / "v1.md").exists()
+
+    def test_delete_missing_prompt(self, manager):
+        assert manager.delete_prompt("does_not_exist") is False
+
+
+class TestPromptsDirectorySetup:
+    """Test creation of the default prompts folder."""
+
+    def test_empty_workspace_gets_sample_prompt(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "working_directory", tmp_path)
+
+        manager = FolderBasedPromptManager()
+
+        assert (tmp_path / "prompts" / "welcome_prompt" / "config.yaml").exists()
+        assert "welcome_prompt" in manager.load_prompts()
+
+    def test_existing_prompts_are_left_alone(self, manager, studio_workspace):
+        assert not (studio_workspace / "welcome_prompt").exists()
+
+
+class TestPromptMtime:
+    """Test the cheap change signature used by Studio's prompt cache."""
+
+    def test_mtime_tracks_version_edits(self, manager, studio_workspace):
+        before = manager.get_prompt_mtime("beta")
+        v1_file = studio_workspace / "beta" / "versions" / "v1.md"
+        os.utime(v1_file, (before + 10, before + 10))
+
+        assert manager.get_prompt_mtime("beta") == before + 10
+
+    def test_mtime_of_missing_prompt(self, manager):
+        assert manager.get_prompt_mtime("does_not_exist") == 0.0
@@ -8,6 +8,7 @@ import pytest
 import tempfile
 import shutil
 import yaml
+import errno
 import io
 import sys
 from pathlib import Path
@@ -330,6 +331,73 @@ class TestVersionManager:
         output = captured_output.getvalue()
         assert "current.md" in output.lower()
 
+    def test_create_then_switch_round_trip(self, temp_workspace):
+        """Test that the version header is added on create and dropped on switch"""
+        vm = VersionManager(str(temp_workspace))
+        agent_dir = temp_workspace / "prompts" / "test_agent"
+        (agent_dir / "current.md").write_text("Line one\nLine two\n")
+
+        with patch('sys.stdout', io.StringIO()):
+            vm.create_version("test_agent", "v010", "Round trip")
+            vm.switch_version("test_agent", "v001")
+            vm.switch_version("test_agent", "v010")
+
+        version_content = (agent_dir / "versions" / "v010.md").read_text()
+        assert version_content.startswith("<!-- Version v010 - Created ")
+        assert version_content.endswith("-->\nLine one\nLine two\n")
+        assert (agent_dir / "current.md").read_text() == "Line one\nLine two\n"
+
+    def test_switch_version_strips_crlf_header(self, temp_workspace):
+        """Test that a version header written with Windows line endings is dropped on switch"""
+        vm = VersionManager(str(temp_workspace))
+        agent_dir = temp_workspace / "prompts" / "test_agent"
+        (agent_dir / "versions" / "v010.md").write_bytes(
+            b"<!-- Version v010 - Created 2024-01-01T00:00:00 -->\r\nLine one\r\nLine two\r\n"
+        )
+
+        with patch('sys.stdout', io.StringIO()):
+            vm.switch_version("test_agent", "v010")
+
+        assert (agent_dir / "current.md").read_bytes() == b"Line one\r\nLine two\r\n"
+
+    def test_create_version_without_copy_file_range(self, temp_workspace):
+        """Test the user-space copy fallback when copy_file_range is unsupported"""
+        vm = VersionManager(str(temp_workspace))
+        agent_dir = temp_workspace / "prompts" / "test_agent"
+
+        def unsupported(*args, **kwargs):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        with patch('os.copy_file_range', unsupported, create=True):
+            with patch('sys.stdout', io.StringIO()):
+                vm.create_version("test_agent", "v010", "Fallback")
+
+        version_content = (agent_dir / "versions" / "v010.md").read_text()
+        assert version_content.endswith("-->\nCurrent version of test agent")
+
+    def test_load_config_cache_returns_copies(self, temp_workspace):
+        """Test that cached configs are not poisoned by callers mutating them"""
+        vm = VersionManager(str(temp_workspace))
+        config_path = temp_workspace / "prompts" / "test_agent" / "config.yaml"
+
+        config = vm.load_config(config_path)
+        config['current_version'] = 'mutated'
+
+        with patch('builtins.open', side_effect=AssertionError("config should come from cache")):
+            cached = vm.load_config(config_path)
+        assert cached['current_version'] == 'v002'
+
+    def test_save_config_invalidates_cache(self, temp_workspace):
+        """Test that saving a config is visible to the next load"""
+        vm = VersionManager(str(temp_workspace))
+        config_path = temp_workspace / "prompts" / "test_agent" / "config.yaml"
+
+        config = vm.load_config(config_path)
+        config['current_version'] = 'v001'
+        assert vm.save_config(config_path, config)
+
+        assert vm.load_config(config_path)['current_version'] == 'v001'
+
 
 class TestVersionManagerErrorHandling:
     """Test error handling in VersionManager"""